@@ -216,6 +216,24 @@ typedef void (*SdsStatusCallback)(const char* table_type, const char* from_node,
  */
 typedef void (*SdsDeviceEvictedCallback)(const char* table_type, const char* node_id, void* user_data);
 
+/**
+ * @brief Callback for batched device eviction (owner role only).
+ *
+ * Called once per sds_loop() eviction sweep with every device evicted during
+ * that sweep, instead of once per device. Useful when many grace periods
+ * expire together (e.g. after a network partition heals).
+ *
+ * The arrays are only valid for the duration of the callback.
+ *
+ * @param table_types Array of table type names, one entry per eviction
+ * @param node_ids Array of evicted device node IDs, parallel to table_types
+ * @param count Number of evictions in this batch
+ * @param user_data User-provided context from sds_on_devices_evicted_batch()
+ *
+ * @see sds_on_devices_evicted_batch
+ */
+typedef void (*SdsDevicesEvictedBatchCallback)(const char** table_types, const char** node_ids, size_t count, void* user_data);
+
 /**
  * @brief Iterator callback for sds_foreach_node().
  * 
@@ -334,6 +352,44 @@ typedef struct {
     uint16_t size;        /**< Size in bytes (for strings: buffer size) */
 } SdsFieldMeta;
 
+/**
+ * @brief Serialize a whole section described by field metadata.
+ *
+ * Walks the descriptor array and writes every field to the JSON writer.
+ * Lets bindings implement an SdsSerializeFunc as a single C call instead
+ * of one JSON-writer call per field.
+ *
+ * @param w JSON writer
+ * @param section Pointer to section data
+ * @param fields Array of field descriptors
+ * @param field_count Number of fields
+ */
+void sds_serialize_section(
+    SdsJsonWriter* w,
+    const void* section,
+    const SdsFieldMeta* fields,
+    uint8_t field_count
+);
+
+/**
+ * @brief Deserialize a whole section described by field metadata.
+ *
+ * Reads every described field from the JSON reader into the section.
+ * Fields missing from the JSON are left untouched. Counterpart of
+ * sds_serialize_section() for implementing SdsDeserializeFunc.
+ *
+ * @param r JSON reader
+ * @param section Pointer to section data
+ * @param fields Array of field descriptors
+ * @param field_count Number of fields
+ */
+void sds_deserialize_section(
+    SdsJsonReader* r,
+    void* section,
+    const SdsFieldMeta* fields,
+    uint8_t field_count
+);
+
 /**
  * @brief Complete metadata for a table type.
  * 
@@ -988,6 +1044,40 @@ bool sds_is_device_online(
     uint32_t timeout_ms
 );
 
+/**
+ * @brief Check liveness of several devices in one call (owner role only).
+ *
+ * Batch variant of sds_is_device_online(). Checks up to 64 devices and
+ * reports the results as a bitmap: bit i of *online_bitmap is set if
+ * node_ids[i] is online. Useful for dashboards that poll the liveness of
+ * every device in a table, avoiding one lookup call per device.
+ *
+ * @code{.c}
+ * const char* ids[] = { "sensor_01", "sensor_02" };
+ * uint64_t bitmap;
+ * sds_are_devices_online(&owner_table, "SensorData", ids, 2, timeout, &bitmap);
+ * if (bitmap & 1) printf("sensor_01 is online\n");
+ * @endcode
+ *
+ * @param owner_table Pointer to owner table structure
+ * @param table_type Table type name
+ * @param node_ids Array of device node IDs to check
+ * @param count Number of entries in node_ids (capped at 64)
+ * @param timeout_ms Liveness timeout (typically 1.5x the liveness interval)
+ * @param online_bitmap Output bitmap; bit i set if node_ids[i] is online
+ * @return Number of devices checked (count, capped at 64), 0 on bad arguments
+ *
+ * @see sds_is_device_online
+ */
+uint8_t sds_are_devices_online(
+    const void* owner_table,
+    const char* table_type,
+    const char* const* node_ids,
+    uint8_t count,
+    uint32_t timeout_ms,
+    uint64_t* online_bitmap
+);
+
 /**
  * @brief Get the liveness interval for a table type.
  * 
@@ -1040,6 +1130,33 @@ uint32_t sds_get_eviction_grace(const char* table_type);
  */
 void sds_on_device_evicted(const char* table_type, SdsDeviceEvictedCallback callback, void* user_data);
 
+/**
+ * @brief Register a batched callback for device eviction events.
+ *
+ * Batch variant of sds_on_device_evicted(): all devices evicted during one
+ * sds_loop() sweep are reported in a single call. If more devices than the
+ * internal batch capacity are evicted in one sweep, the callback fires more
+ * than once. Can be combined with the single-device callback; both are
+ * invoked when set.
+ *
+ * @code{.c}
+ * void on_devices_evicted(const char** table_types, const char** node_ids,
+ *                         size_t count, void* user_data) {
+ *     for (size_t i = 0; i < count; i++) {
+ *         printf("Device %s was evicted from %s\n", node_ids[i], table_types[i]);
+ *     }
+ * }
+ *
+ * sds_on_devices_evicted_batch(on_devices_evicted, NULL);
+ * @endcode
+ *
+ * @param callback Function to call with each eviction batch
+ * @param user_data User context passed to callback
+ *
+ * @see SdsDevicesEvictedBatchCallback, sds_on_device_evicted
+ */
+void sds_on_devices_evicted_batch(SdsDevicesEvictedBatchCallback callback, void* user_data);
+
 /** @} */ // end of owner_helpers group
 
 #ifdef __cplusplus
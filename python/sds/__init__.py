@@ -31,7 +31,7 @@ __version__ = "0.5.1"
 __author__ = "SDS Team"
 
 # Core classes
-from sds.node import SdsNode
+from sds.node import SdsNode, SdsStats
 from sds.table import SdsTable, SectionProxy, DeviceView
 
 # Enums
@@ -64,6 +64,7 @@ __all__ = [
     
     # Core classes
     "SdsNode",
+    "SdsStats",
     "SdsTable",
     "SectionProxy",
     "DeviceView",
@@ -31,6 +31,7 @@ __all__ = [
     "SdsRoleCode",
     "encode_string",
     "decode_string",
+    "decode_string_interned",
 ]
 
 
@@ -81,10 +82,10 @@ def encode_string(s: str | None) -> bytes | ffi.CData:
 def decode_string(c_str: ffi.CData) -> str | None:
     """
     Decode a C string (char*) to a Python string.
-    
+
     Args:
         c_str: C string pointer
-        
+
     Returns:
         Python string or None if pointer is NULL
     """
@@ -93,6 +94,38 @@ def decode_string(c_str: ffi.CData) -> str | None:
     return ffi.string(c_str).decode("utf-8")
 
 
+# Interning cache for decode_string_interned. Keyed by bytes value, not
+# pointer address: callback arguments can point into reused parse buffers,
+# so the address is not a stable identity. Bounded by wholesale clear -
+# the working set (table types + node IDs) is far below the cap, so the
+# cache effectively never cycles in practice.
+_DECODE_CACHE: dict[bytes, str] = {}
+_DECODE_CACHE_MAX = 1024
+
+
+def decode_string_interned(c_str: ffi.CData) -> str | None:
+    """
+    Decode a C string, interning the result.
+
+    Same contract as decode_string, but repeated values (table types and
+    node IDs recur on every callback) return the same str object without
+    re-running UTF-8 decoding. Use for identifier-like strings only, not
+    arbitrary payloads.
+    """
+    if c_str == ffi.NULL:
+        return None
+    raw = ffi.string(c_str)
+    cached = _DECODE_CACHE.get(raw)
+    if cached is None:
+        if len(_DECODE_CACHE) >= _DECODE_CACHE_MAX:
+            _DECODE_CACHE.clear()
+        # Intern so dispatch lookups keyed by these strings hit the
+        # dict identity fast path (registration interns its keys too)
+        cached = sys.intern(raw.decode("utf-8"))
+        _DECODE_CACHE[raw] = cached
+    return cached
+
+
 def get_error_string(error_code: int) -> str:
     """Get human-readable error message for an error code."""
     c_str = lib.sds_error_string(error_code)
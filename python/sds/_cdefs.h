@@ -105,6 +105,7 @@ typedef bool (*SdsVersionMismatchCallback)(
     const char* remote_version
 );
 typedef void (*SdsDeviceEvictedCallback)(const char* table_type, const char* node_id, void* user_data);
+typedef void (*SdsDevicesEvictedBatchCallback)(const char** table_types, const char** node_ids, size_t count, void* user_data);
 
 /* ============== JSON Writer/Reader (opaque for Python) ============== */
 
@@ -146,6 +147,20 @@ typedef struct {
     uint16_t size;
 } SdsFieldMeta;
 
+void sds_serialize_section(
+    SdsJsonWriter* w,
+    const void* section,
+    const SdsFieldMeta* fields,
+    uint8_t field_count
+);
+
+void sds_deserialize_section(
+    SdsJsonReader* r,
+    void* section,
+    const SdsFieldMeta* fields,
+    uint8_t field_count
+);
+
 /* ============== Table Metadata ============== */
 
 typedef struct {
@@ -244,6 +259,13 @@ uint8_t sds_get_table_count(void);
 
 /* ============== Event Callbacks ============== */
 
+/* New-style (extern "Python") callback entry points, implemented in
+ * sds.node. Compiled into the extension, so inbound events skip the
+ * libffi trampoline that ffi.callback objects go through. */
+extern "Python" void _sds_py_config_cb(const char* table_type, void* user_data);
+extern "Python" void _sds_py_state_cb(const char* table_type, const char* from_node, void* user_data);
+extern "Python" void _sds_py_status_cb(const char* table_type, const char* from_node, void* user_data);
+
 void sds_on_config_update(const char* table_type, SdsConfigCallback callback, void* user_data);
 void sds_on_state_update(const char* table_type, SdsStateCallback callback, void* user_data);
 void sds_on_status_update(const char* table_type, SdsStatusCallback callback, void* user_data);
@@ -291,10 +313,23 @@ bool sds_is_device_online(
     uint32_t timeout_ms
 );
 
+uint8_t sds_are_devices_online(
+    const void* owner_table,
+    const char* table_type,
+    const char* const* node_ids,
+    uint8_t count,
+    uint32_t timeout_ms,
+    uint64_t* online_bitmap
+);
+
 uint32_t sds_get_liveness_interval(const char* table_type);
 
+/* Platform clock (same millisecond base the liveness checks use) */
+uint32_t sds_platform_millis(void);
+
 uint32_t sds_get_eviction_grace(const char* table_type);
 void sds_on_device_evicted(const char* table_type, SdsDeviceEvictedCallback callback, void* user_data);
+void sds_on_devices_evicted_batch(SdsDevicesEvictedBatchCallback callback, void* user_data);
 void sds_set_owner_eviction_offsets(
     const char* table_type,
     size_t eviction_pending_offset,
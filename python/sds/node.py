@@ -7,29 +7,195 @@ with a clean, Pythonic API including context managers and decorators.
 Thread Safety:
     SdsNode is thread-safe. Multiple threads can safely call poll(),
     register_table(), and access table data. A reentrant lock (RLock)
-    protects all critical sections.
+    protects all critical sections. Nodes constructed with
+    single_threaded=True skip the locking entirely and must only be
+    used from one thread.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
+import string
+import sys
 import threading
 import time
 import weakref
-from typing import Any, Callable, Dict, Optional, Type, Union, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, NamedTuple, Optional, Type, Union, TYPE_CHECKING
 
 from sds.types import Role, ErrorCode, SdsError, SdsMqttError, SdsValidationError, check_error
 
 # Maximum node ID length (matches C library SDS_MAX_NODE_ID_LEN - 1 for null terminator)
 MAX_NODE_ID_LEN = 31
 
+# Characters allowed in a node ID. Checked with frozenset.issuperset, which
+# scans the string in a single C loop - cheaper than a regex match.
+_NODE_ID_ALLOWED = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Status slot header layout for Python-schema tables (matches the C struct):
+# - node_id: 32 bytes (SDS_MAX_NODE_ID_LEN)
+# - valid: 1 byte
+# - online: 1 byte
+# - eviction_pending: 1 byte
+# - padding: 1 byte (for uint32 alignment)
+# - last_seen_ms: 4 bytes
+# - eviction_deadline: 4 bytes
+# - status: per-schema status section follows
+_SDS_MAX_NODE_ID_LEN = 32
+_SLOT_VALID_OFFSET = _SDS_MAX_NODE_ID_LEN  # 32
+_SLOT_ONLINE_OFFSET = _SDS_MAX_NODE_ID_LEN + 1  # 33
+_SLOT_EVICTION_PENDING_OFFSET = _SDS_MAX_NODE_ID_LEN + 2  # 34
+# padding at 35 for uint32 alignment
+_SLOT_LAST_SEEN_OFFSET = _SDS_MAX_NODE_ID_LEN + 4  # 36 (aligned)
+_SLOT_EVICTION_DEADLINE_OFFSET = _SDS_MAX_NODE_ID_LEN + 8  # 40
+_SLOT_STATUS_OFFSET = _SDS_MAX_NODE_ID_LEN + 12  # 44
+_MAX_STATUS_SLOTS = 8
+
 # Module logger
 logger = logging.getLogger(__name__)
 
 # Import CFFI bindings (will fail if extension not built)
-from sds._bindings import ffi, lib, encode_string, decode_string
+from sds._bindings import ffi, lib, encode_string, decode_string, decode_string_interned
 
 # Import table wrapper (import here to avoid circular imports)
 from sds.table import SdsTable
+from sds.tables import FieldType, PythonTableMeta, analyze_dataclass
+
+# Allocator for reusable scratch out-parameters. Skips the memset that
+# ffi.new() normally does - scratches are always written before read.
+_scratch_alloc = ffi.new_allocator(should_clear_after_alloc=False)
+
+# Pre-bound hot-path C functions. cffi's lib resolves attributes through
+# a dict on every access; binding the functions called in tight loops
+# (poll, liveness checks, stats) to module globals makes each call a
+# single LOAD_GLOBAL. Cold paths keep the explicit lib. prefix.
+_sds_loop = lib.sds_loop
+_sds_is_connected = lib.sds_is_connected
+_sds_get_stats = lib.sds_get_stats
+_sds_is_device_online = lib.sds_is_device_online
+_sds_are_devices_online = lib.sds_are_devices_online
+_sds_get_liveness_interval = lib.sds_get_liveness_interval
+_sds_is_ready = lib.sds_is_ready
+_NULL = ffi.NULL
+
+# FieldType -> SdsFieldType (C enum)
+_C_FIELD_TYPE = {
+    FieldType.BOOL: lib.SDS_FIELD_BOOL,
+    FieldType.UINT8: lib.SDS_FIELD_UINT8,
+    FieldType.INT8: lib.SDS_FIELD_INT8,
+    FieldType.UINT16: lib.SDS_FIELD_UINT16,
+    FieldType.INT16: lib.SDS_FIELD_INT16,
+    FieldType.UINT32: lib.SDS_FIELD_UINT32,
+    FieldType.INT32: lib.SDS_FIELD_INT32,
+    FieldType.FLOAT32: lib.SDS_FIELD_FLOAT,
+    FieldType.STRING: lib.SDS_FIELD_STRING,
+}
+
+# Compiled per-section serializer callbacks, keyed on the schema shape.
+# ffi.callback allocates an executable libffi trampoline per call and the
+# trampolines are never promptly reclaimed, so tables that share a schema
+# (e.g. many nodes registering the same SensorData layout) reuse one pair
+# of callbacks instead of allocating six trampolines per registration.
+_section_callback_cache: Dict[tuple, tuple] = {}
+
+# Shared empty dict for nodes that never register a callback. The
+# copy-on-write registration path replaces the whole dict rather than
+# mutating it, so sharing one sentinel between nodes (and between the
+# three callback kinds) is safe and defers per-node allocation until a
+# decorator actually fires.
+_EMPTY_CALLBACKS: Dict[str, Any] = {}
+
+
+def _decode_or_empty(c_str: Any, _NULL=ffi.NULL) -> str:
+    """Decode a C string, mapping NULL to "" (single NULL check, no
+    truthiness branch at the call sites)."""
+    if c_str == _NULL:
+        return ""
+    return ffi.string(c_str).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_node_id(node_id: str) -> bytes:
+    """Encode a device node ID, memoized - liveness polls re-check the
+    same small set of IDs over and over."""
+    return node_id.encode("utf-8")
+
+
+def _callback_onerror(exception: Any, exc_value: Any, tb: Any) -> None:
+    """
+    Cold-path error hook for CFFI callbacks.
+
+    Passed as onerror= to ffi.callback so the callback bodies need no
+    try/except of their own: CFFI invokes this only when a callback
+    raises, then returns normally to C (which cannot handle Python
+    exceptions).
+    """
+    logger.error(
+        "Unhandled exception in SDS callback",
+        exc_info=(exception, exc_value, tb),
+    )
+
+
+# New-style (extern "Python") dispatch entry points. These are compiled
+# into the extension, so an inbound MQTT event reaches Python through a
+# direct C stub instead of a libffi trampoline. They exist once per
+# process; the owning node is recovered from the user_data handle.
+
+@ffi.def_extern(onerror=_callback_onerror)
+def _sds_py_config_cb(c_table_type, user_data):
+    ffi.from_handle(user_data)._dispatch_config(c_table_type, user_data)
+
+
+@ffi.def_extern(onerror=_callback_onerror)
+def _sds_py_state_cb(c_table_type, c_from_node, user_data):
+    ffi.from_handle(user_data)._dispatch_state(c_table_type, c_from_node, user_data)
+
+
+@ffi.def_extern(onerror=_callback_onerror)
+def _sds_py_status_cb(c_table_type, c_from_node, user_data):
+    ffi.from_handle(user_data)._dispatch_status(c_table_type, c_from_node, user_data)
+
+
+def _compile_section_callbacks(section_info: Any) -> tuple:
+    """
+    Compile a section schema into (serialize_cb, deserialize_cb, keepalive).
+
+    The schema is turned into an SdsFieldMeta descriptor array (the same
+    metadata the C library uses for delta sync) and the callbacks make a
+    single C call that walks it, so the CFFI boundary is crossed once per
+    section. Results are cached by schema fingerprint.
+    """
+    fingerprint = tuple(
+        (f.name, f.field_type, f.offset, f.size, f.string_len)
+        for f in section_info.fields
+    )
+    cached = _section_callback_cache.get(fingerprint)
+    if cached is not None:
+        return cached
+
+    fields = section_info.fields
+    n = len(fields)
+    names = [ffi.new("char[]", f.name.encode("utf-8")) for f in fields]
+    descs = ffi.new("SdsFieldMeta[]", n)
+    for i, f in enumerate(fields):
+        descs[i].name = names[i]
+        descs[i].type = _C_FIELD_TYPE[f.field_type]
+        descs[i].offset = f.offset
+        # For strings, size is the buffer size
+        descs[i].size = f.string_len if f.field_type is FieldType.STRING else f.size
+
+    @ffi.callback("SdsSerializeFunc", onerror=_callback_onerror)
+    def serialize(section_ptr, writer_ptr, _descs=descs, _n=n):
+        lib.sds_serialize_section(writer_ptr, section_ptr, _descs, _n)
+
+    @ffi.callback("SdsDeserializeFunc", onerror=_callback_onerror)
+    def deserialize(section_ptr, reader_ptr, _descs=descs, _n=n):
+        lib.sds_deserialize_section(reader_ptr, section_ptr, _descs, _n)
+
+    entry = (serialize, deserialize, (descs, names))
+    _section_callback_cache[fingerprint] = entry
+    return entry
 
 
 # Type aliases for callbacks
@@ -39,6 +205,41 @@ StatusCallback = Callable[[str, str], None]
 ErrorCallback = Callable[[int, str], None]
 VersionMismatchCallback = Callable[[str, str, str, str], bool]
 DeviceEvictedCallback = Callable[[str, str], None]  # (table_type, node_id)
+DevicesEvictedBatchCallback = Callable[[list], None]  # list of (table_type, node_id)
+
+
+class SdsStats(NamedTuple):
+    """Runtime statistics snapshot (mirrors the C SdsStats struct).
+
+    Tuple-compact with attribute access; as_dict() is available where a
+    plain mapping is wanted."""
+    messages_sent: int
+    messages_received: int
+    reconnect_count: int
+    errors: int
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the statistics as a plain dict."""
+        return self._asdict()
+
+
+@dataclass
+class _TableEntry:
+    """Per-table bookkeeping held in SdsNode._tables (slotted: entries are
+    hit on every liveness/callback path, so reads are attribute loads)."""
+    __slots__ = ("role", "buffer", "meta", "table", "tt_cbuf", "serializers",
+                 "liveness_ms", "default_timeout_ms")
+    role: Role
+    buffer: Any
+    meta: Any
+    table: SdsTable
+    tt_cbuf: Any
+    serializers: Optional[Dict[str, Any]]
+    # Lazily cached sds_get_liveness_interval result and the derived
+    # default liveness timeout (1.5x); fixed for the lifetime of the
+    # registration, so the entry itself is the TTL
+    liveness_ms: Optional[int]
+    default_timeout_ms: Optional[int]
 
 
 class SdsNode:
@@ -69,10 +270,25 @@ class SdsNode:
         port: MQTT broker port
     """
     
-    # Class-level storage for callback instances to prevent GC
-    _instances: weakref.WeakSet["SdsNode"] = weakref.WeakSet()
-    _current_instance: Optional["SdsNode"] = None
-    
+    # Fixed attribute layout: slot descriptors instead of a per-instance
+    # __dict__, which speeds up the attribute reads on the poll() hot path
+    # and shrinks each node. __weakref__ is needed for the WeakSet/finalizer.
+    __slots__ = (
+        "_node_id", "_broker_host", "_port", "_username", "_password",
+        "_connect_timeout_ms", "_retry_count", "_retry_delay_ms",
+        "_eviction_grace_ms", "_enable_delta_sync", "_delta_float_tolerance",
+        "_lock", "_initialized", "_tables", "_config",
+        "_config_callbacks", "_state_callbacks", "_status_callbacks",
+        "_error_callback", "_version_mismatch_callback", "_eviction_callback",
+        "_eviction_batch_callback",
+        "_raw_callbacks", "_raw_callback_handle", "_c_callbacks", "_handle",
+        "_owner_tables",
+        "_finalizer", "_config_node_id", "_config_broker",
+        "_config_username", "_config_password", "_options_scratch",
+        "_buffer_pool",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         node_id: str,
@@ -88,6 +304,7 @@ class SdsNode:
         eviction_grace_ms: int = 0,
         enable_delta_sync: bool = False,
         delta_float_tolerance: float = 0.001,
+        single_threaded: bool = False,
     ):
         """
         Create an SDS node.
@@ -111,7 +328,12 @@ class SdsNode:
                               changed since the last sync, reducing bandwidth usage.
             delta_float_tolerance: Float comparison tolerance for delta sync (default: 0.001)
                                   Float values within this tolerance are considered unchanged.
-        
+            single_threaded: Skip internal locking (default: False). When True,
+                            the RLock normally taken by poll() and table access
+                            is replaced with a no-op, removing per-call lock
+                            overhead. Only safe when all access to this node
+                            and its tables happens from a single thread.
+
         Raises:
             SdsValidationError: If node_id is invalid
             SdsError: If auto_init is True and initialization fails
@@ -124,8 +346,7 @@ class SdsNode:
                 f"node_id '{node_id}' exceeds maximum length of {MAX_NODE_ID_LEN} characters"
             )
         # Check for invalid characters (only allow alphanumeric, underscore, hyphen)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', node_id):
+        if not _NODE_ID_ALLOWED.issuperset(node_id):
             raise SdsValidationError(
                 f"node_id '{node_id}' contains invalid characters. "
                 "Only alphanumeric, underscore, and hyphen are allowed."
@@ -143,29 +364,61 @@ class SdsNode:
         self._enable_delta_sync = enable_delta_sync
         self._delta_float_tolerance = delta_float_tolerance
         
-        # Thread safety lock - reentrant to allow nested calls
-        self._lock = threading.RLock()
+        # Thread safety lock - reentrant to allow nested calls. In
+        # single-threaded mode a no-op context manager stands in: RLock
+        # acquisition costs hundreds of ns per poll() and is pure overhead
+        # when the user polls from one thread (the common case).
+        if single_threaded:
+            self._lock = contextlib.nullcontext()
+        else:
+            self._lock = threading.RLock()
         
         self._initialized = False
-        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._tables: Dict[str, _TableEntry] = {}
+        # Owner-role subset of _tables: lets the liveness fast path do a
+        # single lookup with no role branch
+        self._owner_tables: Dict[str, _TableEntry] = {}
+
+        # C config struct, built lazily on first init() and reused by
+        # re-inits (connection parameters are fixed at construction)
+        self._config: Optional[Any] = None
+
+        # Shared SdsTableOptions scratch for register_table calls; the C
+        # side copies what it needs before returning
+        self._options_scratch = ffi.new("SdsTableOptions*")
+        # Table buffers retired by unregister_table, reused (re-zeroed) if
+        # the same table type is registered again with the same size -
+        # avoids repeated multi-KB CFFI allocations on reconnect loops
+        self._buffer_pool: Dict[str, Any] = {}
         
         # Callback storage (keyed by table_type)
-        self._config_callbacks: Dict[str, ConfigCallback] = {}
-        self._state_callbacks: Dict[str, StateCallback] = {}
-        self._status_callbacks: Dict[str, StatusCallback] = {}
+        self._config_callbacks: Dict[str, ConfigCallback] = _EMPTY_CALLBACKS
+        self._state_callbacks: Dict[str, StateCallback] = _EMPTY_CALLBACKS
+        self._status_callbacks: Dict[str, StatusCallback] = _EMPTY_CALLBACKS
         self._error_callback: Optional[ErrorCallback] = None
         self._version_mismatch_callback: Optional[VersionMismatchCallback] = None
         self._eviction_callback: Optional[DeviceEvictedCallback] = None
+        self._eviction_batch_callback: Optional[DevicesEvictedBatchCallback] = None
         
         # Raw subscription callback storage
         self._raw_callbacks: Dict[str, Callable[[str, bytes], None]] = {}
         self._raw_callback_handle: Optional[Any] = None
         
-        # Keep C callback handles alive
-        self._c_callbacks: Dict[str, Any] = {}
-        
-        # Register this instance
-        SdsNode._instances.add(self)
+        # Keep C callback handles alive. Fixed layout: one slot per
+        # callback kind, populated once. Config/state/status dispatch
+        # needs no entry - those are extern "Python" functions compiled
+        # into the extension.
+        self._c_callbacks: Dict[str, Any] = {
+            "error": None,
+            "version_mismatch": None,
+            "eviction": None,
+            "eviction_batch": None,
+        }
+
+        # Handle passed as user_data to the extern "Python" dispatch
+        # entry points so they can recover this node
+        self._handle = ffi.new_handle(self)
+
         
         # Set up a finalizer for reliable cleanup even if __del__ is not called
         self._finalizer = weakref.finalize(self, self._cleanup_class, self._node_id)
@@ -215,46 +468,16 @@ class SdsNode:
         with self._lock:
             if self._initialized:
                 raise SdsError.from_code(ErrorCode.ALREADY_INITIALIZED)
-            
-            # Create config struct
-            config = ffi.new("SdsConfig*")
-            
-            # Allocate string buffers and keep them alive as instance attributes.
-            # CFFI buffers must be stored separately because assigning to struct
-            # fields only copies the pointer, not the Python reference.
-            self._config_node_id = ffi.new("char[]", self._node_id.encode("utf-8"))
-            self._config_broker = ffi.new("char[]", self._broker_host.encode("utf-8"))
-            config.node_id = self._config_node_id
-            config.mqtt_broker = self._config_broker
-            config.mqtt_port = self._port
-            
-            if self._username is not None:
-                self._config_username = ffi.new("char[]", self._username.encode("utf-8"))
-                config.mqtt_username = self._config_username
-            else:
-                self._config_username = None
-                config.mqtt_username = ffi.NULL
-            
-            if self._password is not None:
-                self._config_password = ffi.new("char[]", self._password.encode("utf-8"))
-                config.mqtt_password = self._config_password
-            else:
-                self._config_password = None
-                config.mqtt_password = ffi.NULL
-            
-            # Set eviction grace period
-            config.eviction_grace_ms = self._eviction_grace_ms
-            
-            # Set delta sync configuration
-            config.enable_delta_sync = self._enable_delta_sync
-            config.delta_float_tolerance = self._delta_float_tolerance
-            
-            # Keep config struct alive
-            self._config = config
-            
-            # Set as current instance for callbacks
-            SdsNode._current_instance = self
-            
+
+            config = self._build_config()
+
+            # Fast path: retries disabled, single init attempt
+            if self._retry_count == 0:
+                result = lib.sds_init(config)
+                check_error(result)
+                self._initialized = True
+                return
+
             # Initialize with retry logic
             last_error: Optional[SdsError] = None
             delay_ms = self._retry_delay_ms
@@ -285,7 +508,54 @@ class SdsNode:
             # All retries exhausted
             if last_error:
                 raise last_error
-    
+
+    def _build_config(self) -> Any:
+        """
+        Build (or reuse) the C SdsConfig struct for init().
+
+        The struct and its string buffers are created once and cached;
+        connection parameters are fixed at construction, so re-inits
+        (common in tests) skip the encode/allocate cycle entirely.
+        """
+        if self._config is not None:
+            return self._config
+
+        config = ffi.new("SdsConfig*")
+
+        # Allocate string buffers and keep them alive as instance attributes.
+        # CFFI buffers must be stored separately because assigning to struct
+        # fields only copies the pointer, not the Python reference.
+        self._config_node_id = ffi.new("char[]", self._node_id.encode("utf-8"))
+        self._config_broker = ffi.new("char[]", self._broker_host.encode("utf-8"))
+        config.node_id = self._config_node_id
+        config.mqtt_broker = self._config_broker
+        config.mqtt_port = self._port
+
+        if self._username is not None:
+            self._config_username = ffi.new("char[]", self._username.encode("utf-8"))
+            config.mqtt_username = self._config_username
+        else:
+            self._config_username = None
+            config.mqtt_username = ffi.NULL
+
+        if self._password is not None:
+            self._config_password = ffi.new("char[]", self._password.encode("utf-8"))
+            config.mqtt_password = self._config_password
+        else:
+            self._config_password = None
+            config.mqtt_password = ffi.NULL
+
+        # Set eviction grace period
+        config.eviction_grace_ms = self._eviction_grace_ms
+
+        # Set delta sync configuration
+        config.enable_delta_sync = self._enable_delta_sync
+        config.delta_float_tolerance = self._delta_float_tolerance
+
+        # Keep config struct alive
+        self._config = config
+        return config
+
     def shutdown(self) -> None:
         """
         Shutdown SDS and disconnect from the MQTT broker.
@@ -298,10 +568,15 @@ class SdsNode:
                 lib.sds_shutdown()
                 self._initialized = False
                 self._tables.clear()
-                
-                if SdsNode._current_instance is self:
-                    SdsNode._current_instance = None
+                self._owner_tables.clear()
+                self._buffer_pool.clear()
+
+                # Clean shutdown - nothing left for the finalizer to do
+                self._finalizer.detach()
     
+    # __enter__/__exit__ are hand-written deliberately - keep it that way.
+    # A @contextlib.contextmanager generator would add generator-resume
+    # overhead to a protocol that is two plain method calls here.
     def __enter__(self) -> "SdsNode":
         """Enter context manager."""
         return self
@@ -312,6 +587,11 @@ class SdsNode:
     
     def __del__(self) -> None:
         """Destructor - ensure cleanup."""
+        # Nothing to do if never initialized or already shut down cleanly;
+        # skipping avoids redundant C teardown during interpreter exit
+        # (getattr guard: __del__ can run on a half-constructed instance)
+        if not getattr(self, "_initialized", False):
+            return
         try:
             self.shutdown()
         except Exception:
@@ -321,16 +601,19 @@ class SdsNode:
     def is_ready(self) -> bool:
         """
         Check if SDS is initialized and connected.
-        
-        Thread-safe.
-        
+
+        Lock-free advisory check: _initialized is a single-reference read
+        (atomic under the GIL) and sds_is_ready() only reads C state, so
+        no lock is taken. Safe to busy-wait on from any thread; the value
+        may be stale by the time the caller acts on it, like any
+        status poll.
+
         Returns:
             True if connected and ready for operations
         """
-        with self._lock:
-            if not self._initialized:
-                return False
-            return lib.sds_is_ready()
+        if not self._initialized:
+            return False
+        return _sds_is_ready()
     
     def is_connected(self) -> bool:
         """
@@ -345,7 +628,7 @@ class SdsNode:
         with self._lock:
             if not self._initialized:
                 return False
-            return lib.sds_is_connected()
+            return _sds_is_connected()
     
     def publish_raw(
         self,
@@ -396,8 +679,7 @@ class SdsNode:
             payload_bytes = payload
         
         with self._lock:
-            if not self._initialized:
-                raise SdsError.from_code(ErrorCode.NOT_INITIALIZED)
+            self._ensure_initialized()
             
             topic_bytes = topic.encode('utf-8')
             result = lib.sds_publish_raw(
@@ -448,8 +730,7 @@ class SdsNode:
             raise ValueError("Topics starting with 'sds/' are reserved")
         
         with self._lock:
-            if not self._initialized:
-                raise SdsError.from_code(ErrorCode.NOT_INITIALIZED)
+            self._ensure_initialized()
             
             # Store callback in our registry
             self._raw_callbacks[topic] = callback
@@ -500,8 +781,7 @@ class SdsNode:
             raise ValueError("topic cannot be empty")
         
         with self._lock:
-            if not self._initialized:
-                raise SdsError.from_code(ErrorCode.NOT_INITIALIZED)
+            self._ensure_initialized()
             
             topic_bytes = topic.encode('utf-8')
             result = lib.sds_unsubscribe_raw(topic_bytes)
@@ -538,15 +818,24 @@ class SdsNode:
         
         This should be called regularly in your main loop. Thread-safe.
         Callbacks are executed while holding the lock.
-        
+
+        The GIL is released for the duration of the underlying C call
+        (CFFI API-mode calls drop it automatically), so other Python
+        threads can run while this node pumps MQTT I/O. The node lock is
+        still held across the call: the C core keeps global state and
+        concurrent sds_* calls from other threads must stay serialized.
+
         Args:
             timeout_ms: Not currently used (reserved for future async support)
         """
+        # Inline the guard: the happy path is one attribute load and a
+        # truth test, with the raise factored into the shared helper.
+        # _initialized is a plain bool, so reading it outside the lock is
+        # safe (same as is_ready).
+        if not self._initialized:
+            self._ensure_initialized()
         with self._lock:
-            if not self._initialized:
-                raise SdsError.from_code(ErrorCode.NOT_INITIALIZED)
-            
-            lib.sds_loop()
+            _sds_loop()
     
     def register_table(
         self,
@@ -598,6 +887,9 @@ class SdsNode:
             )
             table.state.temperature = 23.5
         """
+        # Intern the key so every later dict lookup on this table type
+        # (dispatch, get_table, liveness) hits the identity fast path
+        table_type = sys.intern(table_type)
         with self._lock:
             return self._register_table_impl(
                 table_type=table_type,
@@ -609,6 +901,29 @@ class SdsNode:
                 status_schema=status_schema,
             )
     
+    def _ensure_initialized(
+        self,
+        _from_code=SdsError.from_code,
+        _code=ErrorCode.NOT_INITIALIZED,
+    ) -> None:
+        """Raise NOT_INITIALIZED unless init() has run.
+
+        The exception factory and code are pre-bound as defaults so the
+        guard is a single method call with no module-attribute chain; the
+        exception itself is still built fresh per raise (instances carry
+        a traceback, so a shared singleton would pin frames)."""
+        if not self._initialized:
+            raise _from_code(_code)
+
+    def _alloc_table_buffer(self, table_type: str, table_size: int) -> Any:
+        """Return a zeroed table buffer, reusing a pooled one when the same
+        table type re-registers at the same size (reconnect loops)."""
+        pooled = self._buffer_pool.pop(table_type, None)
+        if pooled is not None and len(pooled) == table_size:
+            ffi.memmove(pooled, bytes(table_size), table_size)
+            return pooled
+        return ffi.new(f"char[{table_size}]")
+
     def _register_table_impl(
         self,
         table_type: str,
@@ -621,19 +936,23 @@ class SdsNode:
         status_schema: Optional[Type] = None,
     ) -> SdsTable:
         """Internal implementation of register_table (called with lock held)."""
-        # Extract schemas from bundle if provided
+        # Encode the table type once; the buffer is stored with the table
+        # entry and reused for every subsequent C call that names this table.
+        tt_cbuf = ffi.new("char[]", table_type.encode("utf-8"))
+        # Extract schemas from bundle if provided (single getattr per
+        # section; hasattr would do the same lookup twice and build an
+        # AttributeError on every miss)
         if schema is not None:
-            if hasattr(schema, 'Config') and config_schema is None:
-                config_schema = schema.Config
-            if hasattr(schema, 'State') and state_schema is None:
-                state_schema = schema.State
-            if hasattr(schema, 'Status') and status_schema is None:
-                status_schema = schema.Status
-        if not self._initialized:
-            raise SdsError.from_code(ErrorCode.NOT_INITIALIZED)
+            if config_schema is None:
+                config_schema = getattr(schema, 'Config', None)
+            if state_schema is None:
+                state_schema = getattr(schema, 'State', None)
+            if status_schema is None:
+                status_schema = getattr(schema, 'Status', None)
+        self._ensure_initialized()
         
         # Look up table metadata from C registry
-        table_meta = lib.sds_find_table_meta(table_type.encode("utf-8"))
+        table_meta = lib.sds_find_table_meta(tt_cbuf)
         
         # If not in C registry, try to use Python schemas directly
         if table_meta == ffi.NULL:
@@ -647,6 +966,7 @@ class SdsNode:
             # Use Python schemas with sds_register_table_ex
             return self._register_table_with_python_schema(
                 table_type=table_type,
+                tt_cbuf=tt_cbuf,
                 role=role,
                 config_schema=config_schema,
                 state_schema=state_schema,
@@ -661,18 +981,19 @@ class SdsNode:
             table_size = table_meta.owner_table_size
         
         # Allocate table structure
-        table_buffer = ffi.new(f"char[{table_size}]")
+        table_buffer = self._alloc_table_buffer(table_type, table_size)
         
-        # Prepare options
+        # Prepare options (C side reads the struct only during the
+        # registration call, so the shared scratch buffer is safe)
         options = ffi.NULL
         if sync_interval_ms is not None:
-            options = ffi.new("SdsTableOptions*")
+            options = self._options_scratch
             options.sync_interval_ms = sync_interval_ms
         
         # Register
         result = lib.sds_register_table(
             table_buffer,
-            table_type.encode("utf-8"),
+            tt_cbuf,
             role.value,
             options
         )
@@ -691,18 +1012,26 @@ class SdsNode:
         )
         
         # Store table info
-        self._tables[table_type] = {
-            "role": role,
-            "buffer": table_buffer,
-            "meta": table_meta,
-            "table": sds_table,
-        }
-        
+        entry = _TableEntry(
+            role=role,
+            buffer=table_buffer,
+            meta=table_meta,
+            table=sds_table,
+            tt_cbuf=tt_cbuf,
+            serializers=None,
+            liveness_ms=None,
+            default_timeout_ms=None,
+        )
+        self._tables[table_type] = entry
+        if role == Role.OWNER:
+            self._owner_tables[table_type] = entry
+
         return sds_table
-    
+
     def _register_table_with_python_schema(
         self,
         table_type: str,
+        tt_cbuf: Any,
         role: Role,
         config_schema: Optional[Type] = None,
         state_schema: Optional[Type] = None,
@@ -714,8 +1043,6 @@ class SdsNode:
         
         Uses sds_register_table_ex with CFFI callbacks for serialization.
         """
-        from sds.tables import analyze_dataclass, TableSectionInfo
-        
         # Analyze schemas to get sizes and offsets
         config_info = analyze_dataclass(config_schema) if config_schema else None
         state_info = analyze_dataclass(state_schema) if state_schema else None
@@ -733,27 +1060,10 @@ class SdsNode:
         status_offset = config_size + state_size
         table_size = config_size + state_size + status_size
         
-        # Status slot layout (matches C struct layout):
-        # - node_id: 32 bytes (SDS_MAX_NODE_ID_LEN)
-        # - valid: 1 byte
-        # - online: 1 byte
-        # - eviction_pending: 1 byte
-        # - padding: 1 byte (for uint32 alignment)
-        # - last_seen_ms: 4 bytes
-        # - eviction_deadline: 4 bytes
-        # - status: status_size bytes
-        SDS_MAX_NODE_ID_LEN = 32
-        slot_node_id_offset = 0
-        slot_valid_offset = SDS_MAX_NODE_ID_LEN  # 32
-        slot_online_offset = SDS_MAX_NODE_ID_LEN + 1  # 33
-        slot_eviction_pending_offset = SDS_MAX_NODE_ID_LEN + 2  # 34
-        # padding at 35 for uint32 alignment
-        slot_last_seen_offset = SDS_MAX_NODE_ID_LEN + 4  # 36 (aligned)
-        slot_eviction_deadline_offset = SDS_MAX_NODE_ID_LEN + 8  # 40
-        slot_status_offset = SDS_MAX_NODE_ID_LEN + 12  # 44
-        slot_size = SDS_MAX_NODE_ID_LEN + 12 + status_size  # 44 + status_size
-        max_slots = 8
-        
+        # Fixed slot layout: the status section follows the slot header
+        slot_size = _SLOT_STATUS_OFFSET + status_size
+        max_slots = _MAX_STATUS_SLOTS
+
         # For owner, add space for status_slots and count
         status_slots_offset = 0
         status_count_offset = 0
@@ -767,22 +1077,23 @@ class SdsNode:
             table_size += slot_size * max_slots
         
         # Allocate table buffer
-        table_buffer = ffi.new(f"char[{table_size}]")
+        table_buffer = self._alloc_table_buffer(table_type, table_size)
         
         # Create serialization/deserialization callbacks
         # We use closures to capture the schema info
         serializers = self._create_serializers(config_info, state_info, status_info, table_buffer)
         
-        # Prepare options
+        # Prepare options (C side reads the struct only during the
+        # registration call, so the shared scratch buffer is safe)
         options = ffi.NULL
         if sync_interval_ms is not None:
-            options = ffi.new("SdsTableOptions*")
+            options = self._options_scratch
             options.sync_interval_ms = sync_interval_ms
         
         # Register using extended API
         result = lib.sds_register_table_ex(
             table_buffer,
-            table_type.encode("utf-8"),
+            tt_cbuf,
             role.value,
             options,
             config_offset, config_size,
@@ -800,46 +1111,46 @@ class SdsNode:
         # For owner, configure status slot tracking
         if role == Role.OWNER:
             lib.sds_set_owner_status_slots(
-                table_type.encode("utf-8"),
+                tt_cbuf,
                 status_slots_offset,
                 slot_size,
-                slot_status_offset,
+                _SLOT_STATUS_OFFSET,
                 status_count_offset,
                 max_slots,
             )
             lib.sds_set_owner_slot_offsets(
-                table_type.encode("utf-8"),
-                slot_valid_offset,
-                slot_online_offset,
-                slot_last_seen_offset,
+                tt_cbuf,
+                _SLOT_VALID_OFFSET,
+                _SLOT_ONLINE_OFFSET,
+                _SLOT_LAST_SEEN_OFFSET,
             )
             # Configure eviction offsets for device eviction support
             lib.sds_set_owner_eviction_offsets(
-                table_type.encode("utf-8"),
-                slot_eviction_pending_offset,
-                slot_eviction_deadline_offset,
+                tt_cbuf,
+                _SLOT_EVICTION_PENDING_OFFSET,
+                _SLOT_EVICTION_DEADLINE_OFFSET,
             )
         
-        # Create a fake table_meta for the SdsTable wrapper
-        # We'll store the info we need directly
-        fake_meta = {
-            "config_offset": config_offset,
-            "config_size": config_size,
-            "state_offset": state_offset,
-            "state_size": state_size,
-            "status_offset": status_offset,
-            "status_size": status_size,
-            "status_slots_offset": status_slots_offset,
-            "status_count_offset": status_count_offset,
-            "slot_size": slot_size,
-            "slot_valid_offset": slot_valid_offset,
-            "slot_online_offset": slot_online_offset,
-            "slot_eviction_pending_offset": slot_eviction_pending_offset,
-            "slot_last_seen_offset": slot_last_seen_offset,
-            "slot_eviction_deadline_offset": slot_eviction_deadline_offset,
-            "slot_status_offset": slot_status_offset,
-            "max_slots": max_slots,
-        }
+        # Build the Python-side layout metadata for the SdsTable wrapper
+        # (slots dataclass so slot reads are attribute loads, not dict lookups)
+        python_meta = PythonTableMeta(
+            config_offset=config_offset,
+            config_size=config_size,
+            state_offset=state_offset,
+            state_size=state_size,
+            status_offset=status_offset,
+            status_size=status_size,
+            status_slots_offset=status_slots_offset,
+            status_count_offset=status_count_offset,
+            slot_size=slot_size,
+            slot_valid_offset=_SLOT_VALID_OFFSET,
+            slot_online_offset=_SLOT_ONLINE_OFFSET,
+            slot_eviction_pending_offset=_SLOT_EVICTION_PENDING_OFFSET,
+            slot_last_seen_offset=_SLOT_LAST_SEEN_OFFSET,
+            slot_eviction_deadline_offset=_SLOT_EVICTION_DEADLINE_OFFSET,
+            slot_status_offset=_SLOT_STATUS_OFFSET,
+            max_slots=max_slots,
+        )
         
         # Create table wrapper
         sds_table = SdsTable(
@@ -850,18 +1161,24 @@ class SdsNode:
             config_schema=config_schema,
             state_schema=state_schema,
             status_schema=status_schema,
-            python_meta=fake_meta,  # Use Python-calculated offsets
+            python_meta=python_meta,  # Use Python-calculated offsets
             lock=self._lock,
         )
         
         # Store table info
-        self._tables[table_type] = {
-            "role": role,
-            "buffer": table_buffer,
-            "meta": None,
-            "table": sds_table,
-            "serializers": serializers,  # Keep alive
-        }
+        entry = _TableEntry(
+            role=role,
+            buffer=table_buffer,
+            meta=None,
+            table=sds_table,
+            tt_cbuf=tt_cbuf,
+            serializers=serializers,  # Keep alive
+            liveness_ms=None,
+            default_timeout_ms=None,
+        )
+        self._tables[table_type] = entry
+        if role == Role.OWNER:
+            self._owner_tables[table_type] = entry
         
         return sds_table
     
@@ -872,116 +1189,35 @@ class SdsNode:
         status_info: Optional["TableSectionInfo"],
         table_buffer: Any,
     ) -> Dict[str, Any]:
-        """Create CFFI callbacks for serialization."""
-        
-        def make_serialize(section_info: Optional["TableSectionInfo"]):
-            if section_info is None:
-                return ffi.NULL
-            
-            @ffi.callback("SdsSerializeFunc")
-            def serialize(section_ptr, writer_ptr):
-                try:
-                    # Read values from C buffer and write to JSON
-                    for field in section_info.fields:
-                        offset = field.offset
-                        ptr = ffi.cast("char*", section_ptr) + offset
-                        
-                        if field.field_type.value == "float32":
-                            val = ffi.cast("float*", ptr)[0]
-                            lib.sds_json_add_float(writer_ptr, field.name.encode(), val)
-                        elif field.field_type.value == "int8":
-                            val = ffi.cast("int8_t*", ptr)[0]
-                            lib.sds_json_add_int(writer_ptr, field.name.encode(), val)
-                        elif field.field_type.value == "uint8":
-                            val = ffi.cast("uint8_t*", ptr)[0]
-                            lib.sds_json_add_uint(writer_ptr, field.name.encode(), int(val))
-                        elif field.field_type.value == "int16":
-                            val = ffi.cast("int16_t*", ptr)[0]
-                            lib.sds_json_add_int(writer_ptr, field.name.encode(), val)
-                        elif field.field_type.value == "uint16":
-                            val = ffi.cast("uint16_t*", ptr)[0]
-                            lib.sds_json_add_uint(writer_ptr, field.name.encode(), int(val))
-                        elif field.field_type.value == "int32":
-                            val = ffi.cast("int32_t*", ptr)[0]
-                            lib.sds_json_add_int(writer_ptr, field.name.encode(), val)
-                        elif field.field_type.value == "uint32":
-                            val = ffi.cast("uint32_t*", ptr)[0]
-                            lib.sds_json_add_uint(writer_ptr, field.name.encode(), val)
-                        elif field.field_type.value == "bool":
-                            val = ffi.cast("bool*", ptr)[0]
-                            lib.sds_json_add_bool(writer_ptr, field.name.encode(), val)
-                        elif field.field_type.value == "string":
-                            val = ffi.string(ffi.cast("char*", ptr), field.string_len)
-                            lib.sds_json_add_string(writer_ptr, field.name.encode(), val)
-                except Exception as e:
-                    logger.exception(f"Serialize error for {section_info.name if section_info else 'unknown'}")
-            
-            return serialize
-        
-        def make_deserialize(section_info: Optional["TableSectionInfo"]):
+        """
+        Create CFFI callbacks for serialization.
+
+        Sections are compiled (and cached) by _compile_section_callbacks;
+        tables sharing a schema shape reuse the same trampolines.
+        """
+        callbacks: Dict[str, Any] = {}
+        # Descriptor arrays and the name buffers they point into must stay
+        # alive as long as the callbacks; stored alongside them.
+        keepalive: list = []
+
+        for tag, section_info in (
+            ("config", config_info),
+            ("state", state_info),
+            ("status", status_info),
+        ):
             if section_info is None:
-                return ffi.NULL
-            
-            @ffi.callback("SdsDeserializeFunc")
-            def deserialize(section_ptr, reader_ptr):
-                try:
-                    for field in section_info.fields:
-                        offset = field.offset
-                        ptr = ffi.cast("char*", section_ptr) + offset
-                        
-                        if field.field_type.value == "float32":
-                            val = ffi.new("float*")
-                            if lib.sds_json_get_float_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("float*", ptr)[0] = val[0]
-                        elif field.field_type.value == "int8":
-                            val = ffi.new("int32_t*")  # Parse as int32, then cast to int8
-                            if lib.sds_json_get_int_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("int8_t*", ptr)[0] = val[0]
-                        elif field.field_type.value == "uint8":
-                            val = ffi.new("uint8_t*")
-                            if lib.sds_json_get_uint8_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("uint8_t*", ptr)[0] = val[0]
-                        elif field.field_type.value == "int16":
-                            val = ffi.new("int32_t*")  # Parse as int32, then cast to int16
-                            if lib.sds_json_get_int_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("int16_t*", ptr)[0] = val[0]
-                        elif field.field_type.value == "uint16":
-                            val = ffi.new("uint32_t*")  # Parse as uint32, then cast to uint16
-                            if lib.sds_json_get_uint_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("uint16_t*", ptr)[0] = val[0]
-                        elif field.field_type.value == "int32":
-                            val = ffi.new("int32_t*")
-                            if lib.sds_json_get_int_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("int32_t*", ptr)[0] = val[0]
-                        elif field.field_type.value == "uint32":
-                            val = ffi.new("uint32_t*")
-                            if lib.sds_json_get_uint_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("uint32_t*", ptr)[0] = val[0]
-                        elif field.field_type.value == "bool":
-                            val = ffi.new("bool*")
-                            if lib.sds_json_get_bool_field(reader_ptr, field.name.encode(), val):
-                                ffi.cast("bool*", ptr)[0] = val[0]
-                        elif field.field_type.value == "string":
-                            buf = ffi.new(f"char[{field.string_len}]")
-                            if lib.sds_json_get_string_field(reader_ptr, field.name.encode(), buf, field.string_len):
-                                ffi.memmove(ptr, buf, field.string_len)
-                except Exception as e:
-                    logger.exception(f"Deserialize error for {section_info.name if section_info else 'unknown'}")
-            
-            return deserialize
-        
-        # Create and store callbacks (must keep references alive!)
-        callbacks = {
-            "serialize_config": make_serialize(config_info),
-            "deserialize_config": make_deserialize(config_info),
-            "serialize_state": make_serialize(state_info),
-            "deserialize_state": make_deserialize(state_info),
-            "serialize_status": make_serialize(status_info),
-            "deserialize_status": make_deserialize(status_info),
-        }
-        
+                callbacks[f"serialize_{tag}"] = ffi.NULL
+                callbacks[f"deserialize_{tag}"] = ffi.NULL
+                continue
+
+            serialize, deserialize, descs_keepalive = _compile_section_callbacks(section_info)
+            keepalive.append(descs_keepalive)
+            callbacks[f"serialize_{tag}"] = serialize
+            callbacks[f"deserialize_{tag}"] = deserialize
+
+        callbacks["field_descs"] = keepalive
         return callbacks
-    
+
     def unregister_table(self, table_type: str) -> None:
         """
         Unregister a table.
@@ -992,14 +1228,17 @@ class SdsNode:
         Raises:
             SdsError: If the table is not registered
         """
-        if not self._initialized:
-            raise SdsError.from_code(ErrorCode.NOT_INITIALIZED)
+        self._ensure_initialized()
         
-        result = lib.sds_unregister_table(table_type.encode("utf-8"))
+        table_type = sys.intern(table_type)
+        result = lib.sds_unregister_table(self._table_type_cbuf(table_type))
         check_error(result)
         
-        # Remove from our tracking
-        self._tables.pop(table_type, None)
+        # Remove from our tracking, parking the buffer for reuse
+        entry = self._tables.pop(table_type, None)
+        if entry is not None:
+            self._buffer_pool[table_type] = entry.buffer
+        self._owner_tables.pop(table_type, None)
     
     def get_table(self, table_type: str) -> SdsTable:
         """
@@ -1014,13 +1253,14 @@ class SdsNode:
         Raises:
             SdsError: If the table is not registered
         """
-        if table_type not in self._tables:
+        entry = self._tables.get(sys.intern(table_type))
+        if entry is None:
             raise SdsError(
                 ErrorCode.TABLE_NOT_FOUND,
                 f"Table '{table_type}' not registered"
             )
         
-        return self._tables[table_type]["table"]
+        return entry.table
     
     def get_table_count(self) -> int:
         """
@@ -1029,23 +1269,27 @@ class SdsNode:
         Returns:
             Number of currently registered tables
         """
-        return lib.sds_get_table_count()
+        # _tables mirrors the C registry exactly (register_table adds,
+        # unregister_table removes, shutdown clears), so len() answers
+        # this without an FFI round-trip
+        return len(self._tables)
     
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> SdsStats:
         """
         Get runtime statistics.
-        
+
         Returns:
-            Dictionary with keys: messages_sent, messages_received,
-            reconnect_count, errors
-        """
-        stats = lib.sds_get_stats()
-        return {
-            "messages_sent": stats.messages_sent,
-            "messages_received": stats.messages_received,
-            "reconnect_count": stats.reconnect_count,
-            "errors": stats.errors,
-        }
+            SdsStats named tuple with fields: messages_sent,
+            messages_received, reconnect_count, errors. Use .as_dict()
+            for a plain dictionary.
+        """
+        stats = _sds_get_stats()
+        return SdsStats(
+            stats.messages_sent,
+            stats.messages_received,
+            stats.reconnect_count,
+            stats.errors,
+        )
     
     # ============== Callback Registration ==============
     
@@ -1064,8 +1308,15 @@ class SdsNode:
         Returns:
             Decorator function
         """
+        table_type = sys.intern(table_type)
+
         def decorator(func: ConfigCallback) -> ConfigCallback:
-            self._config_callbacks[table_type] = func
+            # Copy-on-write: dispatch reads the dict without the lock from
+            # the polling thread, so mutate a copy and swap the reference
+            # (attribute assignment is atomic)
+            callbacks = dict(self._config_callbacks)
+            callbacks[table_type] = func
+            self._config_callbacks = callbacks
             self._setup_config_callback(table_type)
             return func
         return decorator
@@ -1085,8 +1336,13 @@ class SdsNode:
         Returns:
             Decorator function
         """
+        table_type = sys.intern(table_type)
+
         def decorator(func: StateCallback) -> StateCallback:
-            self._state_callbacks[table_type] = func
+            # Copy-on-write swap (see on_config)
+            callbacks = dict(self._state_callbacks)
+            callbacks[table_type] = func
+            self._state_callbacks = callbacks
             self._setup_state_callback(table_type)
             return func
         return decorator
@@ -1106,8 +1362,13 @@ class SdsNode:
         Returns:
             Decorator function
         """
+        table_type = sys.intern(table_type)
+
         def decorator(func: StatusCallback) -> StatusCallback:
-            self._status_callbacks[table_type] = func
+            # Copy-on-write swap (see on_config)
+            callbacks = dict(self._status_callbacks)
+            callbacks[table_type] = func
+            self._status_callbacks = callbacks
             self._setup_status_callback(table_type)
             return func
         return decorator
@@ -1137,73 +1398,123 @@ class SdsNode:
             return func
         return decorator
     
+    def on_devices_evicted(self) -> Callable[[DevicesEvictedBatchCallback], DevicesEvictedBatchCallback]:
+        """
+        Decorator to register a batched device eviction callback (owner role only).
+        
+        Batch variant of on_device_evicted(): all devices evicted during one
+        poll() sweep are delivered in a single call as a list of
+        (table_type, node_id) tuples, instead of one callback per device.
+        
+        Example:
+            @node.on_devices_evicted()
+            def handle_evictions(evicted: list):
+                for table_type, node_id in evicted:
+                    print(f"Device {node_id} was evicted from {table_type}")
+        
+        Note:
+            Eviction is only triggered if eviction_grace_ms > 0 was set
+            when creating the SdsNode.
+            
+        Returns:
+            Decorator function
+        """
+        def decorator(func: DevicesEvictedBatchCallback) -> DevicesEvictedBatchCallback:
+            self._eviction_batch_callback = func
+            self._setup_eviction_batch_callback()
+            return func
+        return decorator
+    
     def _setup_eviction_callback(self) -> None:
-        """Set up the C-level eviction callback."""
-        @ffi.callback("SdsDeviceEvictedCallback")
+        """Set up the C-level eviction callback (trampoline created once;
+        errors are routed to _callback_onerror like the other dispatchers)."""
+        if self._c_callbacks["eviction"] is not None:
+            return
+
+        @ffi.callback("SdsDeviceEvictedCallback", onerror=_callback_onerror)
         def c_callback(c_table_type, c_node_id, user_data):
-            try:
-                ttype = decode_string(c_table_type)
-                node_id = decode_string(c_node_id)
-                if ttype and node_id and self._eviction_callback:
-                    self._eviction_callback(ttype, node_id)
-            except Exception:
-                # Log but don't propagate - C code can't handle Python exceptions
-                logger.exception("Error in eviction callback")
-        
+            ttype = decode_string_interned(c_table_type)
+            node_id = decode_string_interned(c_node_id)
+            if ttype and node_id and self._eviction_callback:
+                self._eviction_callback(ttype, node_id)
+
         # Keep callback alive
         self._c_callbacks["eviction"] = c_callback
         # Pass NULL for table_type since eviction callback is global
         lib.sds_on_device_evicted(ffi.NULL, c_callback, ffi.NULL)
     
-    def _setup_config_callback(self, table_type: str) -> None:
-        """Set up the C-level config callback."""
-        @ffi.callback("SdsConfigCallback")
-        def c_callback(c_table_type, user_data):
-            try:
-                ttype = decode_string(c_table_type)
-                if ttype and ttype in self._config_callbacks:
-                    self._config_callbacks[ttype](ttype)
-            except Exception:
-                # Log but don't propagate - C code can't handle Python exceptions
-                logger.exception(f"Error in config callback for {table_type}")
-        
+    def _setup_eviction_batch_callback(self) -> None:
+        """Set up the C-level batched eviction callback (trampoline created
+        once; errors are routed to _callback_onerror)."""
+        if self._c_callbacks["eviction_batch"] is not None:
+            return
+
+        @ffi.callback("SdsDevicesEvictedBatchCallback", onerror=_callback_onerror)
+        def c_callback(c_table_types, c_node_ids, count, user_data):
+            cb = self._eviction_batch_callback
+            if cb is not None:
+                cb([
+                    (decode_string_interned(c_table_types[i]),
+                     decode_string_interned(c_node_ids[i]))
+                    for i in range(count)
+                ])
+
         # Keep callback alive
-        self._c_callbacks[f"config_{table_type}"] = c_callback
-        lib.sds_on_config_update(table_type.encode("utf-8"), c_callback, ffi.NULL)
+        self._c_callbacks["eviction_batch"] = c_callback
+        lib.sds_on_devices_evicted_batch(c_callback, ffi.NULL)
     
+    # The _dispatch_* bodies carry no try/except: errors are routed to
+    # _callback_onerror by CFFI, so the per-message happy path stays free
+    # of exception-handling setup and nothing propagates into C.
+
+    def _dispatch_config(self, c_table_type: Any, user_data: Any) -> None:
+        """Shared C-level config callback - fans out by table_type."""
+        ttype = decode_string_interned(c_table_type)
+        cb = self._config_callbacks.get(ttype) if ttype else None
+        if cb is not None:
+            cb(ttype)
+
+    def _dispatch_state(self, c_table_type: Any, c_from_node: Any, user_data: Any) -> None:
+        """Shared C-level state callback - fans out by table_type."""
+        ttype = decode_string_interned(c_table_type)
+        from_node = decode_string_interned(c_from_node)
+        cb = self._state_callbacks.get(ttype) if ttype else None
+        if cb is not None and from_node:
+            cb(ttype, from_node)
+
+    def _dispatch_status(self, c_table_type: Any, c_from_node: Any, user_data: Any) -> None:
+        """Shared C-level status callback - fans out by table_type."""
+        ttype = decode_string_interned(c_table_type)
+        from_node = decode_string_interned(c_from_node)
+        cb = self._status_callbacks.get(ttype) if ttype else None
+        if cb is not None and from_node:
+            cb(ttype, from_node)
+
+    def _table_type_cbuf(self, table_type: str) -> Any:
+        """
+        Return the cached C string for a table type.
+
+        Registered tables carry a persistent char[] buffer created at
+        registration; reusing it avoids re-encoding the name on every C
+        call. Unregistered types fall back to a fresh encode so callers
+        don't have to special-case (the C side rejects unknown types).
+        """
+        entry = self._tables.get(table_type)
+        if entry is not None:
+            return entry.tt_cbuf
+        return table_type.encode("utf-8")
+
+    def _setup_config_callback(self, table_type: str) -> None:
+        """Register the extern "Python" config dispatcher for a table type."""
+        lib.sds_on_config_update(self._table_type_cbuf(table_type), lib._sds_py_config_cb, self._handle)
+
     def _setup_state_callback(self, table_type: str) -> None:
-        """Set up the C-level state callback."""
-        @ffi.callback("SdsStateCallback")
-        def c_callback(c_table_type, c_from_node, user_data):
-            try:
-                ttype = decode_string(c_table_type)
-                from_node = decode_string(c_from_node)
-                if ttype and from_node and ttype in self._state_callbacks:
-                    self._state_callbacks[ttype](ttype, from_node)
-            except Exception:
-                # Log but don't propagate - C code can't handle Python exceptions
-                logger.exception(f"Error in state callback for {table_type}")
-        
-        # Keep callback alive
-        self._c_callbacks[f"state_{table_type}"] = c_callback
-        lib.sds_on_state_update(table_type.encode("utf-8"), c_callback, ffi.NULL)
-    
+        """Register the extern "Python" state dispatcher for a table type."""
+        lib.sds_on_state_update(self._table_type_cbuf(table_type), lib._sds_py_state_cb, self._handle)
+
     def _setup_status_callback(self, table_type: str) -> None:
-        """Set up the C-level status callback."""
-        @ffi.callback("SdsStatusCallback")
-        def c_callback(c_table_type, c_from_node, user_data):
-            try:
-                ttype = decode_string(c_table_type)
-                from_node = decode_string(c_from_node)
-                if ttype and from_node and ttype in self._status_callbacks:
-                    self._status_callbacks[ttype](ttype, from_node)
-            except Exception:
-                # Log but don't propagate - C code can't handle Python exceptions
-                logger.exception(f"Error in status callback for {table_type}")
-        
-        # Keep callback alive
-        self._c_callbacks[f"status_{table_type}"] = c_callback
-        lib.sds_on_status_update(table_type.encode("utf-8"), c_callback, ffi.NULL)
+        """Register the extern "Python" status dispatcher for a table type."""
+        lib.sds_on_status_update(self._table_type_cbuf(table_type), lib._sds_py_status_cb, self._handle)
     
     def on_error(self, callback: ErrorCallback) -> ErrorCallback:
         """
@@ -1224,18 +1535,10 @@ class SdsNode:
             The callback function (for decorator use)
         """
         self._error_callback = callback
-        
-        @ffi.callback("SdsErrorCallback")
-        def c_callback(c_error_code, c_context):
-            try:
-                context = decode_string(c_context) or ""
-                self._error_callback(int(c_error_code), context)
-            except Exception:
-                logger.exception("Error in error callback")
-        
-        # Keep callback alive
-        self._c_callbacks["error"] = c_callback
-        lib.sds_on_error(c_callback)
+        # Trampoline is created once; re-registration just swaps the
+        # Python-side callback (each ffi.callback burns a libffi closure)
+        if self._c_callbacks["error"] is None:
+            self._install_error_trampoline()
         
         return callback
     
@@ -1264,27 +1567,43 @@ class SdsNode:
             The callback function (for decorator use)
         """
         self._version_mismatch_callback = callback
-        
-        @ffi.callback("SdsVersionMismatchCallback")
+        # Trampoline is created once; re-registration just swaps the
+        # Python-side callback
+        if self._c_callbacks["version_mismatch"] is None:
+            self._install_version_mismatch_trampoline()
+
+        return callback
+
+    def _install_error_trampoline(self) -> None:
+        """Create and register the C error trampoline (once per node)."""
+        @ffi.callback("SdsErrorCallback", onerror=_callback_onerror)
+        def c_callback(c_error_code, c_context):
+            cb = self._error_callback
+            if cb is not None:
+                cb(int(c_error_code), _decode_or_empty(c_context))
+
+        # Keep callback alive
+        self._c_callbacks["error"] = c_callback
+        lib.sds_on_error(c_callback)
+
+    def _install_version_mismatch_trampoline(self) -> None:
+        """Create and register the C version-mismatch trampoline (once per node)."""
+        @ffi.callback("SdsVersionMismatchCallback", onerror=_callback_onerror)
         def c_callback(c_table_type, c_device_id, c_local_ver, c_remote_ver):
-            try:
-                table_type = decode_string(c_table_type) or ""
-                device_id = decode_string(c_device_id) or ""
-                local_ver = decode_string(c_local_ver) or ""
-                remote_ver = decode_string(c_remote_ver) or ""
-                return self._version_mismatch_callback(
-                    table_type, device_id, local_ver, remote_ver
-                )
-            except Exception:
-                logger.exception("Error in version mismatch callback")
+            cb = self._version_mismatch_callback
+            if cb is None:
                 return False
-        
+            return cb(
+                decode_string_interned(c_table_type) or "",
+                decode_string_interned(c_device_id) or "",
+                _decode_or_empty(c_local_ver),
+                _decode_or_empty(c_remote_ver),
+            )
+
         # Keep callback alive
         self._c_callbacks["version_mismatch"] = c_callback
         lib.sds_on_version_mismatch(c_callback)
-        
-        return callback
-    
+
     # ============== Owner Helper Methods ==============
     
     def is_device_online(
@@ -1312,31 +1631,107 @@ class SdsNode:
         Raises:
             SdsError: If table is not registered or not owner role
         """
-        if table_type not in self._tables:
-            raise SdsError(
-                ErrorCode.TABLE_NOT_FOUND,
-                f"Table '{table_type}' not registered"
-            )
-        
-        table_info = self._tables[table_type]
-        if table_info["role"] != Role.OWNER:
+        # Single lookup in the owner-only map: a hit means registered AND
+        # owner, so the hot path needs no role comparison
+        entry = self._owner_tables.get(sys.intern(table_type))
+        if entry is None:
+            if table_type not in self._tables:
+                raise SdsError(
+                    ErrorCode.TABLE_NOT_FOUND,
+                    f"Table '{table_type}' not registered"
+                )
             raise SdsError(
                 ErrorCode.INVALID_ROLE,
                 "is_device_online() requires OWNER role"
             )
-        
+
+        tt_cbuf = entry.tt_cbuf
         if timeout_ms is None:
-            # Default to 1.5x the liveness interval
-            liveness = lib.sds_get_liveness_interval(table_type.encode("utf-8"))
-            timeout_ms = int(liveness * 1.5)
-        
-        return lib.sds_is_device_online(
-            table_info["buffer"],
-            table_type.encode("utf-8"),
-            device_node_id.encode("utf-8"),
+            # Default to 1.5x the liveness interval (cached on the entry,
+            # so the steady state makes no extra FFI call and no float math)
+            timeout_ms = entry.default_timeout_ms
+            if timeout_ms is None:
+                liveness = _sds_get_liveness_interval(tt_cbuf)
+                entry.liveness_ms = liveness
+                timeout_ms = int(liveness * 1.5)
+                entry.default_timeout_ms = timeout_ms
+
+        return _sds_is_device_online(
+            entry.buffer,
+            tt_cbuf,
+            _encode_node_id(device_node_id),
             timeout_ms
         )
     
+    def is_devices_online(
+        self,
+        table_type: str,
+        node_ids: list[str],
+        timeout_ms: Optional[int] = None,
+    ) -> list[bool]:
+        """
+        Check liveness of several devices in one call (owner role only).
+
+        Batch variant of is_device_online(). All devices are checked in a
+        single C call instead of one FFI crossing per device, which matters
+        for dashboards polling the liveness of every device in a table.
+
+        Args:
+            table_type: Table type name
+            node_ids: Device node IDs to check
+            timeout_ms: Liveness timeout (default: 1.5x liveness interval)
+
+        Returns:
+            List of booleans, one per node ID, in input order
+
+        Raises:
+            SdsError: If table is not registered or not owner role
+        """
+        # Single lookup in the owner-only map (see is_device_online)
+        entry = self._owner_tables.get(sys.intern(table_type))
+        if entry is None:
+            if table_type not in self._tables:
+                raise SdsError(
+                    ErrorCode.TABLE_NOT_FOUND,
+                    f"Table '{table_type}' not registered"
+                )
+            raise SdsError(
+                ErrorCode.INVALID_ROLE,
+                "is_devices_online() requires OWNER role"
+            )
+
+        if not node_ids:
+            return []
+
+        tt_cbuf = entry.tt_cbuf
+        if timeout_ms is None:
+            # Default to 1.5x the liveness interval (cached on the entry,
+            # so the steady state makes no extra FFI call and no float math)
+            timeout_ms = entry.default_timeout_ms
+            if timeout_ms is None:
+                liveness = _sds_get_liveness_interval(tt_cbuf)
+                entry.liveness_ms = liveness
+                timeout_ms = int(liveness * 1.5)
+                entry.default_timeout_ms = timeout_ms
+
+        buffer = entry.buffer
+        bitmap = ffi.new("uint64_t*")
+        results: list[bool] = []
+
+        # The C bitmap holds 64 devices per call; chunk larger lists
+        for start in range(0, len(node_ids), 64):
+            chunk = node_ids[start:start + 64]
+            # Keep the encoded id buffers alive for the duration of the call
+            keepalive = [ffi.new("char[]", _encode_node_id(nid)) for nid in chunk]
+            c_ids = ffi.new("const char*[]", keepalive)
+            _sds_are_devices_online(
+                buffer, tt_cbuf, c_ids, len(chunk), timeout_ms, bitmap
+            )
+            bits = bitmap[0]
+            results.extend(bool((bits >> i) & 1) for i in range(len(chunk)))
+
+        return results
+
     def get_liveness_interval(self, table_type: str) -> int:
         """
         Get the liveness interval for a table type.
@@ -1347,7 +1742,7 @@ class SdsNode:
         Returns:
             Liveness interval in milliseconds
         """
-        return lib.sds_get_liveness_interval(table_type.encode("utf-8"))
+        return _sds_get_liveness_interval(self._table_type_cbuf(sys.intern(table_type)))
     
     def get_eviction_grace(self) -> int:
         """
@@ -1356,8 +1751,9 @@ class SdsNode:
         Returns:
             Eviction grace period in milliseconds (0 = disabled)
         """
-        # Pass NULL since eviction grace is now global
-        return lib.sds_get_eviction_grace(ffi.NULL)
+        # The C side only ever takes this value from SdsConfig at init,
+        # which mirrors this attribute - no FFI round-trip needed
+        return self._eviction_grace_ms
     
     @property
     def eviction_grace_ms(self) -> int:
@@ -1374,6 +1770,10 @@ class SdsNode:
         """The float comparison tolerance for delta sync."""
         return self._delta_float_tolerance
     
+    # Process-wide schema version, cached on the class because the C
+    # state it mirrors is global. Refreshed by set_schema_version().
+    _schema_version_cache: Optional[str] = None
+
     def get_schema_version(self) -> str:
         """
         Get the current schema version.
@@ -1381,8 +1781,12 @@ class SdsNode:
         Returns:
             Schema version string
         """
-        c_str = lib.sds_get_schema_version()
-        return decode_string(c_str) or "unknown"
+        version = SdsNode._schema_version_cache
+        if version is None:
+            c_str = lib.sds_get_schema_version()
+            version = decode_string(c_str) or "unknown"
+            SdsNode._schema_version_cache = version
+        return version
     
     def set_schema_version(self, version: str) -> None:
         """
@@ -1393,10 +1797,16 @@ class SdsNode:
         
         Args:
             version: Schema version string (e.g., "1.2.0")
-        
+
+        Note:
+            This is a single C-level write and is not guarded by the node
+            lock. Call it from one thread, before registering tables (as
+            shown below); there is nothing to serialize against at that
+            point.
+
         Example:
             node.set_schema_version("1.2.0")
             table = node.register_table("SensorData", Role.DEVICE)
         """
-        with self._lock:
-            lib.sds_set_schema_version(version.encode("utf-8"))
+        lib.sds_set_schema_version(version.encode("utf-8"))
+        SdsNode._schema_version_cache = version
@@ -22,14 +22,108 @@ from sds._bindings import ffi, lib, decode_string
 from sds.types import Role, ErrorCode, SdsError
 from sds.tables import (
     FieldType,
+    PythonTableMeta,
     TableFieldInfo,
     TableSectionInfo,
     analyze_dataclass,
     _FIELD_FORMATS,
+    _FIELD_STRUCTS,
 )
 
 T = TypeVar("T")
 
+# Pre-bound FFI helpers: hot paths hit a module global instead of an
+# attribute lookup on ffi per call
+_cast = ffi.cast
+_memmove = ffi.memmove
+_NULL = ffi.NULL
+
+# SectionProxy's own slot attributes - hashed set check in __setattr__
+# instead of a linear tuple scan on every field write
+_INTERNAL_ATTRS = frozenset(("_section_info", "_buffer_ptr", "_readonly", "_lock"))
+
+
+def _scalar_reader(ctype, as_bool=False):
+    """Build a reader for a scalar field accessed through the given C type."""
+    if as_bool:
+        def _read(field_ptr, field, _cast=ffi.cast, _t=ctype):
+            return bool(_cast(_t, field_ptr)[0])
+    else:
+        def _read(field_ptr, field, _cast=ffi.cast, _t=ctype):
+            return _cast(_t, field_ptr)[0]
+    return _read
+
+
+def _scalar_writer(ctype, convert):
+    """Build a writer for a scalar field accessed through the given C type."""
+    def _write(field_ptr, field, value, _cast=ffi.cast, _t=ctype, _conv=convert):
+        _cast(_t, field_ptr)[0] = _conv(value)
+    return _write
+
+
+def _string_reader(field_ptr, field):
+    """Read a fixed-length string field (NUL scan done in C by ffi.string)."""
+    return ffi.string(field_ptr, field.string_len or 32).decode("utf-8", errors="replace")
+
+
+def _string_writer(field_ptr, field, value):
+    """Write a fixed-length string field, truncating with a warning if needed."""
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+    else:
+        encoded = bytes(value)
+    width = field.string_len or 32
+    max_len = width - 1
+    if len(encoded) > max_len:
+        logger.warning(
+            f"String truncated for field '{field.name}': {len(encoded)} bytes exceeds "
+            f"max {max_len} bytes (truncating to '{encoded[:max_len].decode('utf-8', errors='replace')}')"
+        )
+        encoded = encoded[:max_len]
+    ffi.memmove(field_ptr, bytes(width), width)
+    if encoded:
+        ffi.memmove(field_ptr, encoded, len(encoded))
+
+
+def _build_accessor_tables():
+    """Build reader/writer tables indexed by FieldType.tag."""
+    readers = [None] * len(FieldType)
+    writers = [None] * len(FieldType)
+    for field_type, ctype in (
+        (FieldType.INT8, "int8_t*"),
+        (FieldType.UINT8, "uint8_t*"),
+        (FieldType.INT16, "int16_t*"),
+        (FieldType.UINT16, "uint16_t*"),
+        (FieldType.INT32, "int32_t*"),
+        (FieldType.UINT32, "uint32_t*"),
+    ):
+        readers[field_type.tag] = _scalar_reader(ctype)
+        writers[field_type.tag] = _scalar_writer(ctype, int)
+    readers[FieldType.FLOAT32.tag] = _scalar_reader("float*")
+    writers[FieldType.FLOAT32.tag] = _scalar_writer("float*", float)
+    readers[FieldType.BOOL.tag] = _scalar_reader("uint8_t*", as_bool=True)
+    writers[FieldType.BOOL.tag] = _scalar_writer("uint8_t*", lambda v: 1 if v else 0)
+    readers[FieldType.STRING.tag] = _string_reader
+    writers[FieldType.STRING.tag] = _string_writer
+    return readers, writers
+
+
+# Reader/writer callables indexed by FieldType.tag - O(1) dispatch for the
+# generic proxy paths instead of an if/elif ladder over every field type
+_FIELD_READERS, _FIELD_WRITERS = _build_accessor_tables()
+
+# NumPy format strings per field type (for the optional status_array() view)
+_NUMPY_FORMATS = {
+    FieldType.INT8: "i1",
+    FieldType.UINT8: "u1",
+    FieldType.INT16: "i2",
+    FieldType.UINT16: "u2",
+    FieldType.INT32: "i4",
+    FieldType.UINT32: "u4",
+    FieldType.FLOAT32: "f4",
+    FieldType.BOOL: "?",
+}
+
 
 class SectionProxy:
     """
@@ -66,16 +160,14 @@ class SectionProxy:
             lock: Optional RLock for thread-safe access
         """
         object.__setattr__(self, "_section_info", section_info)
-        object.__setattr__(self, "_buffer_ptr", buffer_ptr)
+        # Pre-cast to char* once so field access is pointer arithmetic only
+        object.__setattr__(self, "_buffer_ptr", _cast("char*", buffer_ptr))
         object.__setattr__(self, "_readonly", readonly)
         object.__setattr__(self, "_lock", lock)
     
     def _find_field(self, name: str) -> Optional[TableFieldInfo]:
         """Find field info by name."""
-        for field in self._section_info.fields:
-            if field.name == name:
-                return field
-        return None
+        return self._section_info.fields_by_name.get(name)
     
     def __getattr__(self, name: str) -> Any:
         """Read a field value from the C buffer. Thread-safe if lock provided."""
@@ -90,39 +182,13 @@ class SectionProxy:
         if field is None:
             raise AttributeError(f"No field named '{name}'")
         
-        # Calculate pointer to field
-        field_ptr = ffi.cast("char*", self._buffer_ptr) + field.offset
-        
-        if field.field_type == FieldType.STRING:
-            # Read null-terminated string
-            raw = ffi.buffer(field_ptr, field.string_len or 32)[:]
-            null_idx = raw.find(b'\x00')
-            if null_idx >= 0:
-                raw = raw[:null_idx]
-            return raw.decode("utf-8", errors="replace")
-        elif field.field_type == FieldType.BOOL:
-            return bool(ffi.cast("uint8_t*", field_ptr)[0])
-        elif field.field_type == FieldType.FLOAT32:
-            return ffi.cast("float*", field_ptr)[0]
-        elif field.field_type == FieldType.INT8:
-            return ffi.cast("int8_t*", field_ptr)[0]
-        elif field.field_type == FieldType.UINT8:
-            return ffi.cast("uint8_t*", field_ptr)[0]
-        elif field.field_type == FieldType.INT16:
-            return ffi.cast("int16_t*", field_ptr)[0]
-        elif field.field_type == FieldType.UINT16:
-            return ffi.cast("uint16_t*", field_ptr)[0]
-        elif field.field_type == FieldType.INT32:
-            return ffi.cast("int32_t*", field_ptr)[0]
-        elif field.field_type == FieldType.UINT32:
-            return ffi.cast("uint32_t*", field_ptr)[0]
-        else:
-            raise ValueError(f"Unknown field type: {field.field_type}")
+        # O(1) dispatch through the tag-indexed reader table
+        return _FIELD_READERS[field.field_type.tag](self._buffer_ptr + field.offset, field)
     
     def __setattr__(self, name: str, value: Any) -> None:
         """Write a field value to the C buffer. Thread-safe if lock provided."""
         # Handle slots during __init__
-        if name in ("_section_info", "_buffer_ptr", "_readonly", "_lock"):
+        if name in _INTERNAL_ATTRS:
             object.__setattr__(self, name, value)
             return
         
@@ -141,44 +207,8 @@ class SectionProxy:
         if field is None:
             raise AttributeError(f"No field named '{name}'")
         
-        # Calculate pointer to field
-        field_ptr = ffi.cast("char*", self._buffer_ptr) + field.offset
-        
-        if field.field_type == FieldType.STRING:
-            # Write null-terminated string
-            if isinstance(value, str):
-                encoded = value.encode("utf-8")
-            else:
-                encoded = bytes(value)
-            max_len = (field.string_len or 32) - 1
-            if len(encoded) > max_len:
-                logger.warning(
-                    f"String truncated for field '{name}': {len(encoded)} bytes exceeds "
-                    f"max {max_len} bytes (truncating to '{encoded[:max_len].decode('utf-8', errors='replace')}')"
-                )
-                encoded = encoded[:max_len]
-            # Zero the buffer first
-            ffi.buffer(field_ptr, field.string_len or 32)[:] = b'\x00' * (field.string_len or 32)
-            # Write the string
-            ffi.buffer(field_ptr, len(encoded))[:] = encoded
-        elif field.field_type == FieldType.BOOL:
-            ffi.cast("uint8_t*", field_ptr)[0] = 1 if value else 0
-        elif field.field_type == FieldType.FLOAT32:
-            ffi.cast("float*", field_ptr)[0] = float(value)
-        elif field.field_type == FieldType.INT8:
-            ffi.cast("int8_t*", field_ptr)[0] = int(value)
-        elif field.field_type == FieldType.UINT8:
-            ffi.cast("uint8_t*", field_ptr)[0] = int(value)
-        elif field.field_type == FieldType.INT16:
-            ffi.cast("int16_t*", field_ptr)[0] = int(value)
-        elif field.field_type == FieldType.UINT16:
-            ffi.cast("uint16_t*", field_ptr)[0] = int(value)
-        elif field.field_type == FieldType.INT32:
-            ffi.cast("int32_t*", field_ptr)[0] = int(value)
-        elif field.field_type == FieldType.UINT32:
-            ffi.cast("uint32_t*", field_ptr)[0] = int(value)
-        else:
-            raise ValueError(f"Unknown field type: {field.field_type}")
+        # O(1) dispatch through the tag-indexed writer table
+        _FIELD_WRITERS[field.field_type.tag](self._buffer_ptr + field.offset, field, value)
     
     def __repr__(self) -> str:
         """Return a representation showing all field values."""
@@ -235,6 +265,300 @@ class SectionProxy:
         for field in self._section_info.fields:
             if field.name in data:
                 setattr(self, field.name, data[field.name])
+    
+    def update(self, **kwargs: Any) -> None:
+        """
+        Update multiple fields with a single copy into the C buffer.
+        
+        The current section contents are staged into a scratch bytearray,
+        all provided fields are packed into it, and the whole section is
+        written back with one memmove - N field writes cost one FFI copy
+        instead of N.
+        
+        Thread-safe if lock was provided. Read-only sections will raise
+        an error.
+        
+        Args:
+            **kwargs: Field names and values to write
+        
+        Raises:
+            AttributeError: If section is read-only or a name is unknown
+        
+        Example:
+            >>> table.state.update(temperature=23.5, humidity=65.0)
+        """
+        if self._readonly:
+            raise AttributeError("Cannot write to read-only section")
+        if not kwargs:
+            return
+        
+        if self._lock:
+            with self._lock:
+                self._update_fields(kwargs)
+        else:
+            self._update_fields(kwargs)
+    
+    def _update_fields(self, values: Dict[str, Any]) -> None:
+        """Internal: pack the given fields and write the section back (no locking)."""
+        info = self._section_info
+        fields_by_name = info.fields_by_name
+        
+        # Stage the current contents so fields not being set are preserved
+        staging = bytearray(info.total_size)
+        _memmove(staging, self._buffer_ptr, info.total_size)
+        
+        for name, value in values.items():
+            field = fields_by_name.get(name)
+            if field is None:
+                raise AttributeError(f"No field named '{name}'")
+            
+            if field.field_type == FieldType.STRING:
+                if isinstance(value, str):
+                    encoded = value.encode("utf-8")
+                else:
+                    encoded = bytes(value)
+                width = field.string_len or 32
+                if len(encoded) > width - 1:
+                    logger.warning(
+                        f"String truncated for field '{name}': {len(encoded)} bytes exceeds "
+                        f"max {width - 1} bytes (truncating to '{encoded[:width - 1].decode('utf-8', errors='replace')}')"
+                    )
+                    encoded = encoded[:width - 1]
+                staging[field.offset:field.offset + width] = encoded.ljust(width, b'\x00')
+            elif field.field_type == FieldType.BOOL:
+                staging[field.offset] = 1 if value else 0
+            elif field.field_type == FieldType.FLOAT32:
+                _FIELD_STRUCTS[field.field_type].pack_into(staging, field.offset, float(value))
+            else:
+                _FIELD_STRUCTS[field.field_type].pack_into(staging, field.offset, int(value))
+        
+        # One copy back into the C buffer
+        _memmove(self._buffer_ptr, staging, info.total_size)
+
+
+# ============== Specialized proxy codegen ==============
+#
+# The generic SectionProxy dispatches every read/write through __getattr__/
+# __setattr__, a field lookup, and a per-type if/elif ladder. For registered
+# tables the schema is fixed, so we generate a subclass per layout with one
+# property per field. Each field's typed pointer is cast once at construction
+# and indexed by position baked into the closure, so field access goes straight
+# through the property descriptor with no lookup, type dispatch, or ffi.cast.
+
+# C pointer type used to access each scalar field type
+_SCALAR_CTYPES = {
+    FieldType.INT8: "int8_t*",
+    FieldType.UINT8: "uint8_t*",
+    FieldType.INT16: "int16_t*",
+    FieldType.UINT16: "uint16_t*",
+    FieldType.INT32: "int32_t*",
+    FieldType.UINT32: "uint32_t*",
+    FieldType.FLOAT32: "float*",
+    FieldType.BOOL: "uint8_t*",
+}
+
+# Cache of generated proxy classes keyed by section layout. Keying by the
+# field layout (rather than section-info identity) lets tables that share a
+# schema share one class, and is immune to id() reuse.
+_PROXY_CLASS_CACHE: Dict[Any, type] = {}
+
+
+def _readonly_setter(self, value):
+    """Shared property setter for read-only proxy classes."""
+    raise AttributeError("Cannot write to read-only section")
+
+
+def _make_scalar_property(name: str, field: TableFieldInfo, ptr_index: int,
+                          readonly: bool) -> property:
+    """Build a property for a numeric/bool field reading its pre-cast pointer."""
+    is_bool = field.field_type == FieldType.BOOL
+    is_float = field.field_type == FieldType.FLOAT32
+
+    def _get(self, _i=ptr_index, _bool=is_bool):
+        lock = self._lock
+        if lock is None:
+            value = self._ptrs[_i][0]
+        else:
+            with lock:
+                value = self._ptrs[_i][0]
+        return bool(value) if _bool else value
+
+    if readonly:
+        _set = _readonly_setter
+    elif is_bool:
+        def _set(self, value, _i=ptr_index):
+            lock = self._lock
+            if lock is None:
+                self._ptrs[_i][0] = 1 if value else 0
+            else:
+                with lock:
+                    self._ptrs[_i][0] = 1 if value else 0
+    else:
+        convert = float if is_float else int
+
+        def _set(self, value, _i=ptr_index, _conv=convert):
+            lock = self._lock
+            if lock is None:
+                self._ptrs[_i][0] = _conv(value)
+            else:
+                with lock:
+                    self._ptrs[_i][0] = _conv(value)
+
+    return property(_get, _set, doc=f"{field.field_type.value} field at offset {field.offset}")
+
+
+def _make_string_property(name: str, field: TableFieldInfo, ptr_index: int,
+                          readonly: bool) -> property:
+    """Build a property for a fixed-length string field."""
+    str_len = field.string_len or 32
+
+    def _read(self, _string=ffi.string, _i=ptr_index, _n=str_len):
+        return _string(self._ptrs[_i], _n).decode("utf-8", errors="replace")
+
+    def _get(self):
+        lock = self._lock
+        if lock is None:
+            return _read(self)
+        with lock:
+            return _read(self)
+
+    def _write(self, value, _memmove=ffi.memmove, _i=ptr_index, _n=str_len,
+               _zeros=bytes(str_len)):
+        if isinstance(value, str):
+            encoded = value.encode("utf-8")
+        else:
+            encoded = bytes(value)
+        max_len = _n - 1
+        if len(encoded) > max_len:
+            logger.warning(
+                f"String truncated for field '{name}': {len(encoded)} bytes exceeds "
+                f"max {max_len} bytes (truncating to '{encoded[:max_len].decode('utf-8', errors='replace')}')"
+            )
+            encoded = encoded[:max_len]
+        field_ptr = self._ptrs[_i]
+        _memmove(field_ptr, _zeros, _n)
+        if encoded:
+            _memmove(field_ptr, encoded, len(encoded))
+
+    if readonly:
+        _set = _readonly_setter
+    else:
+        def _set(self, value):
+            lock = self._lock
+            if lock is None:
+                _write(self, value)
+            else:
+                with lock:
+                    _write(self, value)
+
+    return property(_get, _set, doc=f"string[{str_len}] field at offset {field.offset}")
+
+
+def _make_specialized_init(ptr_specs: Tuple[Tuple[str, int], ...]) -> Any:
+    """
+    Build the __init__ for a specialized proxy class.
+
+    Each field's typed pointer (float*, int32_t*, ... or char* for strings)
+    is cast exactly once here and stored in the _ptrs tuple, so field access
+    is a tuple index plus a C dereference with no per-access ffi.cast.
+    """
+    def __init__(self, section_info, buffer_ptr, readonly=False, lock=None,
+                 _specs=ptr_specs, _cast=ffi.cast):
+        SectionProxy.__init__(self, section_info, buffer_ptr, readonly=readonly, lock=lock)
+        base = self._buffer_ptr  # already char* (cast by SectionProxy.__init__)
+        object.__setattr__(
+            self, "_ptrs",
+            tuple(_cast(ctype, base + offset) for ctype, offset in _specs),
+        )
+    return __init__
+
+
+def _make_section_repr(section_info: TableSectionInfo) -> Optional[Any]:
+    """
+    Build a one-shot __repr__ for an all-scalar contiguous section.
+
+    The whole section is unpacked with a single precompiled Struct and
+    interpolated into a precomputed format string, instead of re-running
+    the full attribute dispatch per field. Returns None (keep the generic
+    per-field __repr__) for empty sections, sections with STRING fields
+    (which need NUL trimming) or non-contiguous layouts.
+    """
+    fields = section_info.fields
+    if not fields:
+        return None
+    expected_offset = 0
+    for field in fields:
+        if field.field_type == FieldType.STRING or field.offset != expected_offset:
+            return None
+        expected_offset += field.size
+    
+    fmt = "=" + "".join(_FIELD_FORMATS[f.field_type][0] for f in fields)
+    section_struct = struct.Struct(fmt)
+    if section_struct.size != section_info.total_size:
+        return None
+    repr_fmt = "Section(" + ", ".join(f"{f.name}=%r" for f in fields) + ")"
+
+    def __repr__(self, _struct=section_struct, _fmt=repr_fmt,
+                 _buf=ffi.buffer, _size=section_info.total_size):
+        lock = self._lock
+        if lock is None:
+            values = _struct.unpack_from(_buf(self._buffer_ptr, _size), 0)
+        else:
+            with lock:
+                values = _struct.unpack_from(_buf(self._buffer_ptr, _size), 0)
+        return _fmt % values
+
+    return __repr__
+
+
+def _specialized_proxy_class(section_info: TableSectionInfo, readonly: bool) -> type:
+    """
+    Get (or generate) the SectionProxy subclass for a section layout.
+
+    Read-write and read-only sections get sibling classes: the read-only
+    variant's setters raise immediately, and the read-write variant's
+    setters skip the flag check entirely. Both replace __setattr__ with
+    object.__setattr__ so writes go through the property descriptors
+    directly instead of the generic dispatch path.
+    """
+    key = (readonly,) + tuple(
+        (f.name, f.field_type, f.offset, f.string_len)
+        for f in section_info.fields
+    )
+    cls = _PROXY_CLASS_CACHE.get(key)
+    if cls is None:
+        ptr_specs = []
+        namespace: Dict[str, Any] = {
+            "__slots__": ("_ptrs",),
+            # Let property descriptors handle field writes directly
+            "__setattr__": object.__setattr__,
+        }
+        for i, field in enumerate(section_info.fields):
+            if field.field_type == FieldType.STRING:
+                ptr_specs.append(("char*", field.offset))
+                namespace[field.name] = _make_string_property(field.name, field, i, readonly)
+            else:
+                ptr_specs.append((_SCALAR_CTYPES[field.field_type], field.offset))
+                namespace[field.name] = _make_scalar_property(field.name, field, i, readonly)
+        namespace["__init__"] = _make_specialized_init(tuple(ptr_specs))
+        repr_impl = _make_section_repr(section_info)
+        if repr_impl is not None:
+            namespace["__repr__"] = repr_impl
+        name = "_ReadOnlySectionProxy" if readonly else "_ReadWriteSectionProxy"
+        cls = type(name, (SectionProxy,), namespace)
+        _PROXY_CLASS_CACHE[key] = cls
+    return cls
+
+
+def _make_section_proxy(
+    section_info: TableSectionInfo,
+    buffer_ptr: Any,
+    readonly: bool = False,
+    lock: Optional[threading.RLock] = None,
+) -> SectionProxy:
+    """Create a specialized section proxy for the given layout."""
+    cls = _specialized_proxy_class(section_info, readonly)
+    return cls(section_info, buffer_ptr, readonly=readonly, lock=lock)
 
 
 class DeviceView:
@@ -242,7 +566,17 @@ class DeviceView:
     Read-only view of a device's data (for owner role).
     
     Provides access to a specific device's state and status data
-    as received by the owner.
+    as received by the owner. The attributes are plain slot-backed
+    values set at construction - the fastest attribute path CPython
+    has - rather than properties over private fields.
+    
+    Attributes:
+        node_id: The device's node ID
+        state: The device's state (read-only proxy, or None)
+        status: The device's status (read-only proxy, or None)
+        online: Whether the device is currently online
+        eviction_pending: Whether eviction timer is running for this device
+        last_seen: Timestamp of the last message from this device (ms)
     
     Example:
         device = table.get_device("sensor_01")
@@ -251,6 +585,8 @@ class DeviceView:
         print(device.online)
     """
     
+    __slots__ = ("node_id", "state", "status", "online", "eviction_pending", "last_seen")
+    
     def __init__(
         self,
         node_id: str,
@@ -271,46 +607,16 @@ class DeviceView:
             last_seen: Timestamp of last message (ms since epoch)
             eviction_pending: Whether eviction timer is running for this device
         """
-        self._node_id = node_id
-        self._state = state_proxy
-        self._status = status_proxy
-        self._online = online
-        self._last_seen = last_seen
-        self._eviction_pending = eviction_pending
-    
-    @property
-    def node_id(self) -> str:
-        """Get the device's node ID."""
-        return self._node_id
-    
-    @property
-    def state(self) -> Optional[SectionProxy]:
-        """Get the device's state (read-only)."""
-        return self._state
-    
-    @property
-    def status(self) -> Optional[SectionProxy]:
-        """Get the device's status (read-only)."""
-        return self._status
-    
-    @property
-    def online(self) -> bool:
-        """Check if the device is online."""
-        return self._online
-    
-    @property
-    def eviction_pending(self) -> bool:
-        """Check if eviction timer is running for this device."""
-        return self._eviction_pending
-    
-    @property
-    def last_seen(self) -> int:
-        """Get the timestamp of the last message from this device."""
-        return self._last_seen
+        self.node_id = node_id
+        self.state = state_proxy
+        self.status = status_proxy
+        self.online = online
+        self.last_seen = last_seen
+        self.eviction_pending = eviction_pending
     
     def __repr__(self) -> str:
-        eviction_str = ", eviction_pending=True" if self._eviction_pending else ""
-        return f"DeviceView(node_id={self._node_id!r}, online={self._online}{eviction_str})"
+        eviction_str = ", eviction_pending=True" if self.eviction_pending else ""
+        return f"DeviceView(node_id={self.node_id!r}, online={self.online}{eviction_str})"
 
 
 class SdsTable:
@@ -370,7 +676,7 @@ class SdsTable:
         config_schema: Optional[Type] = None,
         state_schema: Optional[Type] = None,
         status_schema: Optional[Type] = None,
-        python_meta: Optional[Dict[str, int]] = None,
+        python_meta: Optional[PythonTableMeta] = None,
         lock: Optional[threading.RLock] = None,
     ):
         """
@@ -384,25 +690,33 @@ class SdsTable:
             config_schema: Optional dataclass for config section
             state_schema: Optional dataclass for state section
             status_schema: Optional dataclass for status section
-            python_meta: Optional dict with offsets (for Python-only schemas)
+            python_meta: Optional PythonTableMeta with offsets (for Python-only schemas)
             lock: Optional RLock for thread-safe access
         """
         self._table_type = table_type
+        # Encoded once; reused by every get_device/iter_devices FFI call
+        self._table_type_b = table_type.encode("utf-8")
         self._role = role
         self._buffer = buffer
         self._meta = meta
         self._python_meta = python_meta
         self._lock = lock
-        
-        # Analyze schemas if provided
-        self._config_info = analyze_dataclass(config_schema) if config_schema else None
-        self._state_info = analyze_dataclass(state_schema) if state_schema else None
-        self._status_info = analyze_dataclass(status_schema) if status_schema else None
-        
-        # Store schema classes for creating device views
+        # Encoded node IDs recur on every owner-side lookup; cache them
+        self._node_id_b_cache: Dict[str, bytes] = {}
+        # Reusable slot-iteration callback (created on first iter_devices call;
+        # CFFI callback trampolines are expensive to construct)
+        self._iter_cb: Any = None
+        self._iter_results: list = []
+        
+        # Store schema classes; section layouts are analyzed on first use.
+        # Owner tables with C metadata never build state/status proxies, so
+        # those analysis passes would be wasted at registration time.
         self._config_schema = config_schema
         self._state_schema = state_schema
         self._status_schema = status_schema
+        self._config_info: Optional[TableSectionInfo] = None
+        self._state_info: Optional[TableSectionInfo] = None
+        self._status_info: Optional[TableSectionInfo] = None
         
         # Create section proxies
         self._config_proxy: Optional[SectionProxy] = None
@@ -411,6 +725,30 @@ class SdsTable:
         
         self._setup_proxies()
     
+    def _get_config_info(self) -> Optional[TableSectionInfo]:
+        """Get the config section layout, analyzing the schema on first use."""
+        info = self._config_info
+        if info is None and self._config_schema is not None:
+            info = analyze_dataclass(self._config_schema)
+            self._config_info = info
+        return info
+    
+    def _get_state_info(self) -> Optional[TableSectionInfo]:
+        """Get the state section layout, analyzing the schema on first use."""
+        info = self._state_info
+        if info is None and self._state_schema is not None:
+            info = analyze_dataclass(self._state_schema)
+            self._state_info = info
+        return info
+    
+    def _get_status_info(self) -> Optional[TableSectionInfo]:
+        """Get the status section layout, analyzing the schema on first use."""
+        info = self._status_info
+        if info is None and self._status_schema is not None:
+            info = analyze_dataclass(self._status_schema)
+            self._status_info = info
+        return info
+    
     def _setup_proxies(self) -> None:
         """Set up section proxy objects based on role."""
         buffer_ptr = ffi.cast("char*", self._buffer)
@@ -418,9 +756,9 @@ class SdsTable:
         # Get offsets from C meta or Python meta
         if self._python_meta:
             # Using Python-calculated offsets
-            config_offset = self._python_meta.get("config_offset", 0)
-            state_offset = self._python_meta.get("state_offset", 0)
-            status_offset = self._python_meta.get("status_offset", 0)
+            config_offset = self._python_meta.config_offset
+            state_offset = self._python_meta.state_offset
+            status_offset = self._python_meta.status_offset
         elif self._meta:
             # Using C metadata
             if self._role == Role.DEVICE:
@@ -438,38 +776,44 @@ class SdsTable:
         
         if self._role == Role.DEVICE:
             # Device role: can write state/status, read config
-            if self._config_info:
+            config_info = self._get_config_info()
+            if config_info:
                 config_ptr = buffer_ptr + config_offset
-                self._config_proxy = SectionProxy(
-                    self._config_info, config_ptr, readonly=True, lock=self._lock
+                self._config_proxy = _make_section_proxy(
+                    config_info, config_ptr, readonly=True, lock=self._lock
                 )
             
-            if self._state_info:
+            state_info = self._get_state_info()
+            if state_info:
                 state_ptr = buffer_ptr + state_offset
-                self._state_proxy = SectionProxy(
-                    self._state_info, state_ptr, readonly=False, lock=self._lock
+                self._state_proxy = _make_section_proxy(
+                    state_info, state_ptr, readonly=False, lock=self._lock
                 )
             
-            if self._status_info:
+            status_info = self._get_status_info()
+            if status_info:
                 status_ptr = buffer_ptr + status_offset
-                self._status_proxy = SectionProxy(
-                    self._status_info, status_ptr, readonly=False, lock=self._lock
+                self._status_proxy = _make_section_proxy(
+                    status_info, status_ptr, readonly=False, lock=self._lock
                 )
         
         else:  # OWNER role
             # Owner role: can write config, read state (when devices send updates)
-            if self._config_info:
+            config_info = self._get_config_info()
+            if config_info:
                 config_ptr = buffer_ptr + config_offset
-                self._config_proxy = SectionProxy(
-                    self._config_info, config_ptr, readonly=False, lock=self._lock
+                self._config_proxy = _make_section_proxy(
+                    config_info, config_ptr, readonly=False, lock=self._lock
                 )
             
             # For owner with Python schemas, also set up state proxy (for reading merged state)
-            if self._state_info and self._python_meta:
-                state_ptr = buffer_ptr + state_offset
-                self._state_proxy = SectionProxy(
-                    self._state_info, state_ptr, readonly=True, lock=self._lock
-                )
+            if self._python_meta:
+                state_info = self._get_state_info()
+                if state_info:
+                    state_ptr = buffer_ptr + state_offset
+                    self._state_proxy = _make_section_proxy(
+                        state_info, state_ptr, readonly=True, lock=self._lock
+                    )
             
             # Note: For C meta, state proxy not used for owner - use get_device() instead
     
@@ -594,46 +938,50 @@ class SdsTable:
             slot_last_seen_offset = self._meta.slot_last_seen_offset
             slot_status_offset = self._meta.slot_status_offset
             slot_eviction_pending_offset = getattr(self._meta, 'slot_eviction_pending_offset', 0)
-        elif self._python_meta and "slot_last_seen_offset" in self._python_meta:
-            slot_last_seen_offset = self._python_meta["slot_last_seen_offset"]
-            slot_status_offset = self._python_meta["slot_status_offset"]
-            slot_eviction_pending_offset = self._python_meta.get("slot_eviction_pending_offset", 0)
+        elif self._python_meta is not None:
+            slot_last_seen_offset = self._python_meta.slot_last_seen_offset
+            slot_status_offset = self._python_meta.slot_status_offset
+            slot_eviction_pending_offset = self._python_meta.slot_eviction_pending_offset
         else:
             return None  # No metadata, can't access device slots
         
+        node_id_b = self._node_id_b_cache.get(node_id)
+        if node_id_b is None:
+            node_id_b = self._node_id_b_cache.setdefault(node_id, node_id.encode("utf-8"))
+        
         # Find the device's status (sds_find_node_status returns pointer to STATUS, not slot)
         status_ptr = lib.sds_find_node_status(
             self._buffer,
-            self._table_type.encode("utf-8"),
-            node_id.encode("utf-8"),
+            self._table_type_b,
+            node_id_b,
         )
         
-        if status_ptr == ffi.NULL:
+        if status_ptr == _NULL:
             return None
         
         # Calculate pointer to the slot start (status_ptr - slot_status_offset)
-        slot_char = ffi.cast("char*", status_ptr) - slot_status_offset
+        slot_char = _cast("char*", status_ptr) - slot_status_offset
         
         # Calculate online status
         if timeout_ms is None:
-            liveness = lib.sds_get_liveness_interval(self._table_type.encode("utf-8"))
+            liveness = lib.sds_get_liveness_interval(self._table_type_b)
             timeout_ms = int(liveness * 1.5)
         
         online = lib.sds_is_device_online(
             self._buffer,
-            self._table_type.encode("utf-8"),
-            node_id.encode("utf-8"),
+            self._table_type_b,
+            node_id_b,
             timeout_ms,
         )
         
         # Read last_seen timestamp from slot
-        last_seen_ptr = ffi.cast("uint32_t*", slot_char + slot_last_seen_offset)
+        last_seen_ptr = _cast("uint32_t*", slot_char + slot_last_seen_offset)
         last_seen = last_seen_ptr[0]
         
         # Read eviction_pending flag if available
         eviction_pending = False
         if slot_eviction_pending_offset > 0:
-            eviction_pending_ptr = ffi.cast("bool*", slot_char + slot_eviction_pending_offset)
+            eviction_pending_ptr = _cast("bool*", slot_char + slot_eviction_pending_offset)
             eviction_pending = bool(eviction_pending_ptr[0])
         
         # State is transient (only available during callback), not stored per-device
@@ -641,8 +989,9 @@ class SdsTable:
         
         # Create status proxy from slot data (status_ptr already points to status)
         status_proxy = None
-        if self._status_info:
-            status_proxy = SectionProxy(self._status_info, status_ptr, readonly=True)
+        status_info = self._get_status_info()
+        if status_info:
+            status_proxy = _make_section_proxy(status_info, status_ptr, readonly=True)
         
         return DeviceView(
             node_id=node_id,
@@ -679,27 +1028,181 @@ class SdsTable:
                 "iter_devices() is only available for OWNER role"
             )
         
-        # Collect devices using the C iterator
-        devices: list[str] = []
+        slot_offsets = self._slot_offsets()
+        if slot_offsets is None:
+            return  # No metadata, can't access device slots
+        
+        devices = self._collect_slot_pairs()
         
-        @ffi.callback("SdsNodeIterator")
-        def collector(c_node_id, status_ptr, user_data):
-            node_id = decode_string(c_node_id)
-            if node_id:
-                devices.append(node_id)
+        # Resolve the default timeout once instead of once per device
+        if timeout_ms is None:
+            liveness = lib.sds_get_liveness_interval(self._table_type_b)
+            timeout_ms = int(liveness * 1.5)
+        
+        # One clock read for the whole sweep; same millisecond base the
+        # C-side liveness check uses
+        now = lib.sds_platform_millis()
+        status_info = self._get_status_info()
+        
+        # Build DeviceViews straight from the slot pointers - no per-device
+        # sds_find_node_status/sds_is_device_online round-trips
+        for node_id, status_ptr in devices:
+            yield node_id, self._view_from_slot(
+                node_id, status_ptr, slot_offsets, timeout_ms, now, status_info
+            )
+    
+    def _slot_offsets(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Get (last_seen, online, status, eviction_pending) slot offsets from
+        the C or Python metadata, or None if no metadata is available.
+        """
+        if self._meta is not None:
+            return (
+                self._meta.slot_last_seen_offset,
+                self._meta.slot_online_offset,
+                self._meta.slot_status_offset,
+                getattr(self._meta, 'slot_eviction_pending_offset', 0),
+            )
+        if self._python_meta is not None:
+            meta = self._python_meta
+            return (
+                meta.slot_last_seen_offset,
+                meta.slot_online_offset,
+                meta.slot_status_offset,
+                meta.slot_eviction_pending_offset,
+            )
+        return None
+    
+    def _collect_slot_pairs(self) -> list:
+        """
+        Collect (node_id, status pointer) pairs for all valid slots in one
+        C pass. The slot pointers stay valid after the callback returns -
+        they point into the table buffer, not into transient parse state.
+        The callback trampoline is built once per table and reused.
+        """
+        if self._iter_cb is None:
+            results = self._iter_results
+            
+            @ffi.callback("SdsNodeIterator")
+            def collector(c_node_id, status_ptr, user_data):
+                node_id = decode_string(c_node_id)
+                if node_id:
+                    results.append((node_id, status_ptr))
+            
+            self._iter_cb = collector
         
+        self._iter_results.clear()
         lib.sds_foreach_node(
             self._buffer,
-            self._table_type.encode("utf-8"),
-            collector,
-            ffi.NULL,
+            self._table_type_b,
+            self._iter_cb,
+            _NULL,
+        )
+        # Snapshot so a concurrent/nested iteration can't clobber our results
+        pairs = self._iter_results[:]
+        self._iter_results.clear()
+        return pairs
+    
+    def _view_from_slot(
+        self,
+        node_id: str,
+        status_ptr: Any,
+        slot_offsets: Tuple[int, int, int, int],
+        timeout_ms: int,
+        now: int,
+        status_info: Optional[TableSectionInfo],
+    ) -> DeviceView:
+        """Build a DeviceView by reading slot bookkeeping around status_ptr."""
+        (slot_last_seen_offset, slot_online_offset,
+         slot_status_offset, slot_eviction_pending_offset) = slot_offsets
+        slot_char = _cast("char*", status_ptr) - slot_status_offset
+        
+        online = bool(_cast("bool*", slot_char + slot_online_offset)[0])
+        last_seen = _cast("uint32_t*", slot_char + slot_last_seen_offset)[0]
+        if online:
+            # uint32 wraparound-safe age check, mirroring sds_is_device_online
+            online = ((now - last_seen) & 0xFFFFFFFF) < timeout_ms
+        
+        eviction_pending = False
+        if slot_eviction_pending_offset > 0:
+            eviction_pending = bool(
+                _cast("bool*", slot_char + slot_eviction_pending_offset)[0]
+            )
+        
+        status_proxy = None
+        if status_info:
+            status_proxy = _make_section_proxy(status_info, status_ptr, readonly=True)
+        
+        return DeviceView(
+            node_id=node_id,
+            state_proxy=None,  # State is only available during callback
+            status_proxy=status_proxy,
+            online=online,
+            last_seen=last_seen,
+            eviction_pending=eviction_pending,
         )
+    
+    def get_devices(
+        self,
+        node_ids: list,
+        timeout_ms: Optional[int] = None,
+    ) -> list:
+        """
+        Look up several devices with one C iteration (OWNER role only).
         
-        # Yield DeviceViews for each device
-        for node_id in devices:
-            device = self.get_device(node_id, timeout_ms)
-            if device is not None:
-                yield node_id, device
+        Equivalent to calling get_device() per node ID, but all lookups
+        share a single sds_foreach_node pass instead of separate
+        find/online FFI calls per device.
+        
+        Args:
+            node_ids: Node IDs to look up
+            timeout_ms: Liveness timeout for online check (default: 1.5x liveness)
+        
+        Returns:
+            List aligned with node_ids; None for devices that are not known
+        
+        Raises:
+            SdsError: If not owner role
+        
+        Example:
+            views = table.get_devices(["sensor_01", "sensor_02"])
+            for node_id, device in zip(["sensor_01", "sensor_02"], views):
+                if device is not None:
+                    print(f"{node_id}: online={device.online}")
+        """
+        if self._role != Role.OWNER:
+            raise SdsError(
+                ErrorCode.INVALID_ROLE,
+                "get_devices() is only available for OWNER role"
+            )
+        
+        slot_offsets = self._slot_offsets()
+        if slot_offsets is None:
+            return [None] * len(node_ids)
+        
+        wanted = frozenset(node_ids)
+        pairs = [
+            (node_id, status_ptr)
+            for node_id, status_ptr in self._collect_slot_pairs()
+            if node_id in wanted
+        ]
+        if not pairs:
+            return [None] * len(node_ids)
+        
+        if timeout_ms is None:
+            liveness = lib.sds_get_liveness_interval(self._table_type_b)
+            timeout_ms = int(liveness * 1.5)
+        
+        now = lib.sds_platform_millis()
+        status_info = self._get_status_info()
+        
+        found = {
+            node_id: self._view_from_slot(
+                node_id, status_ptr, slot_offsets, timeout_ms, now, status_info
+            )
+            for node_id, status_ptr in pairs
+        }
+        return [found.get(node_id) for node_id in node_ids]
     
     @property
     def device_count(self) -> int:
@@ -718,18 +1221,112 @@ class SdsTable:
                 "device_count is only available for OWNER role"
             )
         
-        buffer_ptr = ffi.cast("char*", self._buffer)
+        buffer_ptr = _cast("char*", self._buffer)
         
         # Use C metadata or Python metadata
         if self._meta is not None:
             count_offset = self._meta.own_status_count_offset
-        elif self._python_meta and "status_count_offset" in self._python_meta:
-            count_offset = self._python_meta["status_count_offset"]
+        elif self._python_meta is not None:
+            count_offset = self._python_meta.status_count_offset
         else:
             return 0  # No metadata available
         
-        count_ptr = ffi.cast("uint8_t*", buffer_ptr + count_offset)
+        count_ptr = _cast("uint8_t*", buffer_ptr + count_offset)
         return count_ptr[0]
     
+    def status_array(self) -> Any:
+        """
+        Get a zero-copy NumPy view of all status slots (OWNER role only).
+        
+        Returns a read-only structured array over the table's status slot
+        storage with one record per slot. Each record has the bookkeeping
+        fields ``valid``, ``online`` and ``last_seen`` plus one field per
+        status-schema field, so fleet-wide aggregation runs at C speed:
+        
+            arr = table.status_array()
+            live = arr[arr["valid"]]
+            print(live["battery"].mean())
+        
+        Requires numpy (install with ``pip install sds-library[numpy]``).
+        
+        Returns:
+            numpy.ndarray view (read-only, one record per slot)
+        
+        Raises:
+            SdsError: If not owner role or no status schema was provided
+            ImportError: If numpy is not installed
+        """
+        if self._role != Role.OWNER:
+            raise SdsError(
+                ErrorCode.INVALID_ROLE,
+                "status_array() is only available for OWNER role"
+            )
+        status_info = self._get_status_info()
+        if status_info is None:
+            raise SdsError(
+                ErrorCode.INVALID_TABLE,
+                "No status schema provided for this table"
+            )
+        
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "status_array() requires numpy; install with "
+                "'pip install sds-library[numpy]'"
+            ) from None
+        
+        # Get slot layout from C or Python metadata
+        if self._meta is not None:
+            slots_offset = self._meta.own_status_slots_offset
+            slot_size = self._meta.own_status_slot_size
+            status_offset = self._meta.slot_status_offset
+            valid_offset = self._meta.slot_valid_offset
+            online_offset = self._meta.slot_online_offset
+            last_seen_offset = self._meta.slot_last_seen_offset
+            max_slots = self._meta.own_max_status_slots
+        elif self._python_meta is not None:
+            meta = self._python_meta
+            slots_offset = meta.status_slots_offset
+            slot_size = meta.slot_size
+            status_offset = meta.slot_status_offset
+            valid_offset = meta.slot_valid_offset
+            online_offset = meta.slot_online_offset
+            last_seen_offset = meta.slot_last_seen_offset
+            max_slots = meta.max_slots
+        else:
+            raise SdsError(
+                ErrorCode.INVALID_TABLE,
+                "No table metadata available"
+            )
+        
+        # Structured dtype mapping slot bookkeeping + status fields by offset
+        names = ["valid", "online", "last_seen"]
+        formats = ["?", "?", "u4"]
+        offsets = [valid_offset, online_offset, last_seen_offset]
+        for field in status_info.fields:
+            names.append(field.name)
+            if field.field_type == FieldType.STRING:
+                formats.append(f"S{field.string_len or 32}")
+            else:
+                formats.append(_NUMPY_FORMATS[field.field_type])
+            offsets.append(status_offset + field.offset)
+        
+        slot_dtype = np.dtype({
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": slot_size,
+        })
+        
+        slots_buf = ffi.buffer(
+            ffi.cast("char*", self._buffer) + slots_offset,
+            slot_size * max_slots,
+        )
+        arr = np.frombuffer(slots_buf, dtype=slot_dtype)
+        # Status slots are device-written; don't let owners scribble on them
+        arr.flags.writeable = False
+        return arr
+    
     def __repr__(self) -> str:
         return f"SdsTable(type={self._table_type!r}, role={self._role.name})"
@@ -8,6 +8,7 @@ registration with the C library.
 from __future__ import annotations
 
 import struct
+import weakref
 from dataclasses import dataclass, fields, field
 from enum import Enum
 from typing import (
@@ -33,9 +34,20 @@ T = TypeVar("T")
 class FieldType(Enum):
     """
     Supported field types for table sections.
-    
+
     These map to C types used in the SDS library.
+
+    Each member also carries a small contiguous integer ``tag`` (assigned
+    in declaration order) so hot paths can dispatch by array index or
+    integer compare instead of comparing the ``.value`` strings.
     """
+
+    def __new__(cls, value: str) -> "FieldType":
+        obj = object.__new__(cls)
+        obj._value_ = value
+        obj.tag = len(cls.__members__)
+        return obj
+
     INT8 = "int8"
     UINT8 = "uint8"
     INT16 = "int16"
@@ -59,6 +71,12 @@ _FIELD_FORMATS = {
     FieldType.BOOL: ("?", 1),
 }
 
+# Precompiled Struct per scalar type so (de)serialization does not re-parse
+# the format string on every field
+_FIELD_STRUCTS = {
+    field_type: struct.Struct(fmt) for field_type, (fmt, _) in _FIELD_FORMATS.items()
+}
+
 
 def Field(
     field_type: Optional[FieldType] = None,
@@ -155,52 +173,161 @@ class TableFieldInfo:
     string_len: Optional[int] = None
 
 
+@dataclass
+class PythonTableMeta:
+    """
+    Table layout computed in Python for schemas not in the C registry.
+
+    Mirrors the offset information SdsTableMeta provides for C-registered
+    tables. Attribute access (slot descriptors via __slots__) keeps slot
+    reads off the dict-lookup path in SdsTable.
+    """
+    __slots__ = (
+        "config_offset", "config_size",
+        "state_offset", "state_size",
+        "status_offset", "status_size",
+        "status_slots_offset", "status_count_offset",
+        "slot_size", "slot_valid_offset", "slot_online_offset",
+        "slot_eviction_pending_offset", "slot_last_seen_offset",
+        "slot_eviction_deadline_offset", "slot_status_offset",
+        "max_slots",
+    )
+    config_offset: int
+    config_size: int
+    state_offset: int
+    state_size: int
+    status_offset: int
+    status_size: int
+    status_slots_offset: int
+    status_count_offset: int
+    slot_size: int
+    slot_valid_offset: int
+    slot_online_offset: int
+    slot_eviction_pending_offset: int
+    slot_last_seen_offset: int
+    slot_eviction_deadline_offset: int
+    slot_status_offset: int
+    max_slots: int
+
+
 @dataclass
 class TableSectionInfo:
     """Information about a table section (config, state, or status)."""
     fields: list[TableFieldInfo]
     total_size: int
-    
+    # Derived name -> field mapping so hot paths (SectionProxy attribute
+    # access) can look fields up in O(1) instead of scanning the list.
+    fields_by_name: dict[str, TableFieldInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Derived (Struct, offset, names) runs covering the contiguous numeric
+    # stretches of the section, so (de)serialization packs/unpacks each run
+    # with one compiled-Struct call instead of one call per field.
+    _numeric_runs: list = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _string_fields: list = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.fields_by_name = {f.name: f for f in self.fields}
+        
+        runs = []
+        strings = []
+        run_formats: list[str] = []
+        run_names: list[str] = []
+        run_offset = 0
+        next_offset = 0
+        
+        def flush() -> None:
+            if run_formats:
+                runs.append((
+                    struct.Struct("=" + "".join(run_formats)),
+                    run_offset,
+                    tuple(run_names),
+                ))
+                run_formats.clear()
+                run_names.clear()
+        
+        for f in self.fields:
+            if f.field_type == FieldType.STRING:
+                strings.append(f)
+                flush()
+                continue
+            if not run_formats:
+                run_offset = f.offset
+                next_offset = f.offset
+            elif f.offset != next_offset:
+                flush()
+                run_offset = f.offset
+                next_offset = f.offset
+            run_formats.append(_FIELD_FORMATS[f.field_type][0])
+            run_names.append(f.name)
+            next_offset += f.size
+        flush()
+        
+        self._numeric_runs = runs
+        self._string_fields = strings
+
     def serialize(self, data: Any, buffer: bytes) -> bytes:
         """Serialize a dataclass instance to bytes."""
         result = bytearray(self.total_size)
         
-        for field_info in self.fields:
+        for run_struct, run_offset, run_names in self._numeric_runs:
+            try:
+                run_struct.pack_into(
+                    result, run_offset,
+                    *[getattr(data, name, None) for name in run_names],
+                )
+            except (TypeError, struct.error):
+                # A missing/None value in the run - pack field by field,
+                # leaving those fields zeroed like the original behaviour
+                for name in run_names:
+                    value = getattr(data, name, None)
+                    if value is None:
+                        continue
+                    field_info = self.fields_by_name[name]
+                    _FIELD_STRUCTS[field_info.field_type].pack_into(
+                        result, field_info.offset, value
+                    )
+        
+        for field_info in self._string_fields:
             value = getattr(data, field_info.name, None)
             if value is None:
                 continue
-            
-            if field_info.field_type == FieldType.STRING:
-                # Encode string with null terminator
-                encoded = value.encode("utf-8")[:field_info.string_len - 1]
-                result[field_info.offset:field_info.offset + len(encoded)] = encoded
-            else:
-                fmt, _ = _FIELD_FORMATS[field_info.field_type]
-                packed = struct.pack(fmt, value)
-                result[field_info.offset:field_info.offset + len(packed)] = packed
+            # Encode string with null terminator
+            encoded = value.encode("utf-8")[:field_info.string_len - 1]
+            result[field_info.offset:field_info.offset + len(encoded)] = encoded
         
         return bytes(result)
     
-    def deserialize(self, buffer: bytes, cls: Type[T]) -> T:
-        """Deserialize bytes to a dataclass instance."""
+    def deserialize(self, buffer: Any, cls: Type[T]) -> T:
+        """Deserialize a buffer (bytes or any buffer-protocol object) to a dataclass instance."""
         kwargs = {}
         
-        for field_info in self.fields:
-            if field_info.field_type == FieldType.STRING:
-                # Read null-terminated string
-                raw = buffer[field_info.offset:field_info.offset + field_info.string_len]
-                null_idx = raw.find(b'\x00')
-                if null_idx >= 0:
-                    raw = raw[:null_idx]
-                kwargs[field_info.name] = raw.decode("utf-8", errors="replace")
-            else:
-                fmt, size = _FIELD_FORMATS[field_info.field_type]
-                raw = buffer[field_info.offset:field_info.offset + size]
-                kwargs[field_info.name] = struct.unpack(fmt, raw)[0]
+        for run_struct, run_offset, run_names in self._numeric_runs:
+            values = run_struct.unpack_from(buffer, run_offset)
+            for name, value in zip(run_names, values):
+                kwargs[name] = value
+        
+        for field_info in self._string_fields:
+            # Read null-terminated string
+            raw = buffer[field_info.offset:field_info.offset + field_info.string_len]
+            null_idx = raw.find(b'\x00')
+            if null_idx >= 0:
+                raw = raw[:null_idx]
+            kwargs[field_info.name] = raw.decode("utf-8", errors="replace")
         
         return cls(**kwargs)
 
 
+# Layout analysis is a pure function of the class; memoize it so repeated
+# registrations pay for fields()/get_type_hints() only once.  Weak keys let
+# dynamically created schema classes be collected.
+_LAYOUT_CACHE: "weakref.WeakKeyDictionary[type, TableSectionInfo]" = weakref.WeakKeyDictionary()
+
+
 def analyze_dataclass(cls: Type) -> TableSectionInfo:
     """
     Analyze a dataclass to extract field information.
@@ -211,6 +338,10 @@ def analyze_dataclass(cls: Type) -> TableSectionInfo:
     Returns:
         TableSectionInfo with field layout
     """
+    cached = _LAYOUT_CACHE.get(cls)
+    if cached is not None:
+        return cached
+    
     field_infos = []
     offset = 0
     
@@ -246,7 +377,9 @@ def analyze_dataclass(cls: Type) -> TableSectionInfo:
         
         offset += size
     
-    return TableSectionInfo(fields=field_infos, total_size=offset)
+    info = TableSectionInfo(fields=field_infos, total_size=offset)
+    _LAYOUT_CACHE[cls] = info
+    return info
 
 
 def _infer_field_type(hint: Any) -> FieldType:
@@ -284,13 +417,14 @@ class TableSection(Generic[T]):
         self._info = section_info
         self._cls = cls
         self._buffer = buffer
+        # Zero-copy view over the C buffer; deserialize reads it in place
+        # with unpack_from instead of copying the whole section per get()
+        self._view = ffi.buffer(buffer, section_info.total_size)
         self._cache: Optional[T] = None
     
     def get(self) -> T:
         """Get the current section data as a dataclass instance."""
-        # Read from C buffer
-        raw = ffi.buffer(self._buffer, self._info.total_size)[:]
-        return self._info.deserialize(raw, self._cls)
+        return self._info.deserialize(self._view, self._cls)
     
     def set(self, data: T) -> None:
         """Set the section data from a dataclass instance."""
@@ -312,10 +446,13 @@ def create_json_serializer(section_info: TableSectionInfo) -> Callable:
     
     This creates a function compatible with the SdsSerializeFunc callback.
     """
+    # Field keys are fixed per section - encode them once, not per callback
+    keys = {f.name: f.name.encode() for f in section_info.fields}
+    
     @ffi.callback("void(void*, SdsJsonWriter*)")
     def serialize(section_ptr, writer):
-        # Read section data
-        raw = ffi.buffer(section_ptr, section_info.total_size)[:]
+        # Zero-copy view over the section; unpack_from reads it in place
+        raw = ffi.buffer(section_ptr, section_info.total_size)
         
         for field_info in section_info.fields:
             if field_info.field_type == FieldType.STRING:
@@ -325,21 +462,19 @@ def create_json_serializer(section_info: TableSectionInfo) -> Callable:
                 if null_idx >= 0:
                     raw_str = raw_str[:null_idx]
                 value = raw_str.decode("utf-8", errors="replace")
-                lib.sds_json_add_string(writer, field_info.name.encode(), value.encode())
+                lib.sds_json_add_string(writer, keys[field_info.name], value.encode())
             elif field_info.field_type == FieldType.BOOL:
-                value = struct.unpack("?", raw[field_info.offset:field_info.offset + 1])[0]
-                lib.sds_json_add_bool(writer, field_info.name.encode(), value)
+                value = _FIELD_STRUCTS[FieldType.BOOL].unpack_from(raw, field_info.offset)[0]
+                lib.sds_json_add_bool(writer, keys[field_info.name], value)
             elif field_info.field_type == FieldType.FLOAT32:
-                value = struct.unpack("f", raw[field_info.offset:field_info.offset + 4])[0]
-                lib.sds_json_add_float(writer, field_info.name.encode(), value)
+                value = _FIELD_STRUCTS[FieldType.FLOAT32].unpack_from(raw, field_info.offset)[0]
+                lib.sds_json_add_float(writer, keys[field_info.name], value)
             elif field_info.field_type in (FieldType.INT8, FieldType.INT16, FieldType.INT32):
-                fmt, size = _FIELD_FORMATS[field_info.field_type]
-                value = struct.unpack(fmt, raw[field_info.offset:field_info.offset + size])[0]
-                lib.sds_json_add_int(writer, field_info.name.encode(), value)
+                value = _FIELD_STRUCTS[field_info.field_type].unpack_from(raw, field_info.offset)[0]
+                lib.sds_json_add_int(writer, keys[field_info.name], value)
             else:  # Unsigned types
-                fmt, size = _FIELD_FORMATS[field_info.field_type]
-                value = struct.unpack(fmt, raw[field_info.offset:field_info.offset + size])[0]
-                lib.sds_json_add_uint(writer, field_info.name.encode(), value)
+                value = _FIELD_STRUCTS[field_info.field_type].unpack_from(raw, field_info.offset)[0]
+                lib.sds_json_add_uint(writer, keys[field_info.name], value)
     
     return serialize
 
@@ -370,14 +505,11 @@ def create_json_deserializer(section_info: TableSectionInfo) -> Callable:
             elif field_info.field_type == FieldType.FLOAT32:
                 out = ffi.new("float*")
                 if lib.sds_json_get_float_field(reader, key, out):
-                    packed = struct.pack("f", out[0])
-                    result[field_info.offset:field_info.offset + 4] = packed
+                    _FIELD_STRUCTS[FieldType.FLOAT32].pack_into(result, field_info.offset, out[0])
             elif field_info.field_type in (FieldType.INT8, FieldType.INT16, FieldType.INT32):
                 out = ffi.new("int32_t*")
                 if lib.sds_json_get_int_field(reader, key, out):
-                    fmt, size = _FIELD_FORMATS[field_info.field_type]
-                    packed = struct.pack(fmt, out[0])
-                    result[field_info.offset:field_info.offset + size] = packed
+                    _FIELD_STRUCTS[field_info.field_type].pack_into(result, field_info.offset, out[0])
             elif field_info.field_type == FieldType.UINT8:
                 out = ffi.new("uint8_t*")
                 if lib.sds_json_get_uint8_field(reader, key, out):
@@ -385,11 +517,9 @@ def create_json_deserializer(section_info: TableSectionInfo) -> Callable:
             else:  # Other unsigned types
                 out = ffi.new("uint32_t*")
                 if lib.sds_json_get_uint_field(reader, key, out):
-                    fmt, size = _FIELD_FORMATS[field_info.field_type]
-                    packed = struct.pack(fmt, out[0])
-                    result[field_info.offset:field_info.offset + size] = packed
+                    _FIELD_STRUCTS[field_info.field_type].pack_into(result, field_info.offset, out[0])
         
-        # Copy result to section
-        ffi.memmove(section_ptr, bytes(result), section_info.total_size)
+        # Copy result to section (memmove accepts the bytearray directly)
+        ffi.memmove(section_ptr, result, section_info.total_size)
     
     return deserialize
@@ -81,6 +81,24 @@ class TestEvictionCallback:
         # The callback should be stored
         assert node._eviction_callback is not None
         assert node._eviction_callback == handle_eviction
+    
+    def test_on_devices_evicted_decorator_exists(self, unique_node_id):
+        """on_devices_evicted batch decorator method exists."""
+        node = SdsNode(unique_node_id, "localhost", auto_init=False)
+        assert hasattr(node, 'on_devices_evicted')
+        assert callable(node.on_devices_evicted)
+    
+    def test_on_devices_evicted_decorator_registers_callback(self, unique_node_id):
+        """Batch decorator registers the callback function."""
+        node = SdsNode(unique_node_id, "localhost", auto_init=False)
+        
+        @node.on_devices_evicted()
+        def handle_evictions(evicted: list):
+            pass
+        
+        # The callback should be stored
+        assert node._eviction_batch_callback is not None
+        assert node._eviction_batch_callback == handle_evictions
 
 
 class TestDeviceViewEvictionPending:
@@ -154,10 +154,11 @@ class TestSdsNodeWithBroker:
             mqtt_broker_port
         ) as node:
             stats = node.get_stats()
-            assert "messages_sent" in stats
-            assert "messages_received" in stats
-            assert "reconnect_count" in stats
-            assert "errors" in stats
+            assert stats.messages_sent >= 0
+            assert stats.messages_received >= 0
+            assert stats.reconnect_count >= 0
+            assert stats.errors >= 0
+            assert "messages_sent" in stats.as_dict()
     
     def test_node_poll(self, unique_node_id, mqtt_broker_host, mqtt_broker_port):
         """SdsNode.poll() processes events."""
@@ -566,8 +567,7 @@ class TestDeltaSyncWithBroker:
             enable_delta_sync=True
         ) as node:
             stats = node.get_stats()
-            assert "messages_sent" in stats
-            assert isinstance(stats["messages_sent"], int)
+            assert isinstance(stats.messages_sent, int)
     
     def test_delta_sync_poll_works(self, unique_node_id, mqtt_broker_host, mqtt_broker_port):
         """Poll works correctly with delta sync enabled."""
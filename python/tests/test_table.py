@@ -149,6 +149,40 @@ class TestSdsTableDevice:
                     pytest.skip("SensorData table not in registry")
                 raise
     
+    def test_table_state_bulk_update(
+        self,
+        unique_node_id,
+        mqtt_broker_host,
+        mqtt_broker_port,
+    ):
+        """update() writes multiple fields and preserves the rest."""
+        with SdsNode(
+            unique_node_id,
+            mqtt_broker_host,
+            mqtt_broker_port
+        ) as node:
+            try:
+                table = node.register_table(
+                    "SensorData",
+                    Role.DEVICE,
+                    state_schema=SampleState,
+                )
+                
+                table.state.count = 42
+                table.state.update(temperature=23.5, humidity=65.0)
+                
+                assert table.state.temperature == pytest.approx(23.5)
+                assert table.state.humidity == pytest.approx(65.0)
+                # Fields not passed to update() keep their values
+                assert table.state.count == 42
+                
+                with pytest.raises(AttributeError):
+                    table.state.update(no_such_field=1)
+            except SdsError as e:
+                if e.code == ErrorCode.TABLE_NOT_FOUND:
+                    pytest.skip("SensorData table not in registry")
+                raise
+    
     def test_table_status_write(
         self,
         unique_node_id,
@@ -379,6 +413,31 @@ class TestSdsTableOwner:
                     pytest.skip("SensorData table not in registry")
                 raise
     
+    def test_owner_get_devices_returns_none_for_unknown(
+        self,
+        unique_node_id,
+        mqtt_broker_host,
+        mqtt_broker_port,
+    ):
+        """get_devices() returns a None per unknown device."""
+        with SdsNode(
+            f"{unique_node_id}_owner",
+            mqtt_broker_host,
+            mqtt_broker_port
+        ) as node:
+            try:
+                table = node.register_table(
+                    "SensorData",
+                    Role.OWNER,
+                )
+                
+                views = table.get_devices(["ghost_a", "ghost_b"])
+                assert views == [None, None]
+            except SdsError as e:
+                if e.code == ErrorCode.TABLE_NOT_FOUND:
+                    pytest.skip("SensorData table not in registry")
+                raise
+    
     def test_owner_device_count(
         self,
         unique_node_id,
@@ -148,6 +148,18 @@ static bool _lwt_subscribed = false;
 static uint32_t _eviction_grace_ms = 0;
 static SdsDeviceEvictedCallback _eviction_callback = NULL;
 static void* _eviction_user_data = NULL;
+static SdsDevicesEvictedBatchCallback _eviction_batch_callback = NULL;
+static void* _eviction_batch_user_data = NULL;
+
+/* Accumulator for the batch eviction callback. Node IDs are copied because
+ * the slot memory is cleared as each eviction is processed; table type
+ * pointers stay valid (they point into the persistent table contexts).
+ * Flushed when full and at the end of each eviction sweep. */
+#define SDS_EVICTION_BATCH_MAX 32
+static const char* _eviction_batch_tables[SDS_EVICTION_BATCH_MAX];
+static char _eviction_batch_ids[SDS_EVICTION_BATCH_MAX][SDS_MAX_NODE_ID_LEN];
+static const char* _eviction_batch_id_ptrs[SDS_EVICTION_BATCH_MAX];
+static size_t _eviction_batch_count = 0;
 
 /* Delta sync configuration (from SdsConfig) */
 static bool _delta_sync_enabled = false;
@@ -350,6 +362,9 @@ SdsError sds_init(const SdsConfig* config) {
     _eviction_grace_ms = config->eviction_grace_ms;
     _eviction_callback = NULL;
     _eviction_user_data = NULL;
+    _eviction_batch_callback = NULL;
+    _eviction_batch_user_data = NULL;
+    _eviction_batch_count = 0;
     
     if (_eviction_grace_ms > 0) {
         SDS_LOG_I("Device eviction enabled: grace period = %u ms", _eviction_grace_ms);
@@ -400,6 +415,26 @@ SdsError sds_init(const SdsConfig* config) {
     return SDS_OK;
 }
 
+static void flush_eviction_batch(void) {
+    if (_eviction_batch_count == 0) return;
+    if (_eviction_batch_callback) {
+        _eviction_batch_callback(_eviction_batch_tables, _eviction_batch_id_ptrs,
+                                 _eviction_batch_count, _eviction_batch_user_data);
+    }
+    _eviction_batch_count = 0;
+}
+
+static void record_eviction(const char* table_type, const char* node_id) {
+    if (_eviction_batch_count == SDS_EVICTION_BATCH_MAX) {
+        flush_eviction_batch();
+    }
+    _eviction_batch_tables[_eviction_batch_count] = table_type;
+    strncpy(_eviction_batch_ids[_eviction_batch_count], node_id, SDS_MAX_NODE_ID_LEN - 1);
+    _eviction_batch_ids[_eviction_batch_count][SDS_MAX_NODE_ID_LEN - 1] = '\0';
+    _eviction_batch_id_ptrs[_eviction_batch_count] = _eviction_batch_ids[_eviction_batch_count];
+    _eviction_batch_count++;
+}
+
 void sds_loop(void) {
     if (!_initialized) {
         static bool warned = false;
@@ -525,6 +560,9 @@ void sds_loop(void) {
                             if (_eviction_callback) {
                                 _eviction_callback(ctx->table_type, slot_node_id, _eviction_user_data);
                             }
+                            if (_eviction_batch_callback) {
+                                record_eviction(ctx->table_type, slot_node_id);
+                            }
                             
                             /* Clear the slot */
                             *slot_valid = false;
@@ -543,6 +581,9 @@ void sds_loop(void) {
                 }
             }
         }
+
+        /* Report everything evicted this sweep in one callback */
+        flush_eviction_batch();
     }
 }
 
@@ -1217,6 +1258,24 @@ bool sds_is_device_online(const void* owner_table, const char* table_type, const
     return false;  /* Node not found */
 }
 
+uint8_t sds_are_devices_online(const void* owner_table, const char* table_type,
+                               const char* const* node_ids, uint8_t count,
+                               uint32_t timeout_ms, uint64_t* online_bitmap) {
+    if (!online_bitmap) return 0;
+    *online_bitmap = 0;
+
+    if (!owner_table || !table_type || !node_ids) return 0;
+    if (count > 64) count = 64;  /* Bitmap width */
+
+    for (uint8_t i = 0; i < count; i++) {
+        if (node_ids[i] && sds_is_device_online(owner_table, table_type, node_ids[i], timeout_ms)) {
+            *online_bitmap |= (1ULL << i);
+        }
+    }
+
+    return count;
+}
+
 uint32_t sds_get_liveness_interval(const char* table_type) {
     if (!table_type) return 0;
     
@@ -1245,6 +1304,11 @@ void sds_on_device_evicted(const char* table_type, SdsDeviceEvictedCallback call
     _eviction_user_data = user_data;
 }
 
+void sds_on_devices_evicted_batch(SdsDevicesEvictedBatchCallback callback, void* user_data) {
+    _eviction_batch_callback = callback;
+    _eviction_batch_user_data = user_data;
+}
+
 /* ============== Internal Functions ============== */
 
 static SdsTableContext* find_table(const char* table_type) {
@@ -1386,6 +1450,99 @@ static void serialize_field(const SdsFieldMeta* field, const void* section, SdsJ
     }
 }
 
+void sds_serialize_section(SdsJsonWriter* w, const void* section,
+                           const SdsFieldMeta* fields, uint8_t field_count) {
+    if (!w || !section || !fields) return;
+
+    for (uint8_t i = 0; i < field_count; i++) {
+        serialize_field(&fields[i], section, w);
+    }
+}
+
+/**
+ * Deserialize a single field from JSON.
+ *
+ * Narrow integer types parse through int32/uint32 like the generated
+ * deserializers do. Multi-byte stores go through memcpy because packed
+ * section layouts may leave fields unaligned.
+ */
+static void deserialize_field(const SdsFieldMeta* field, void* section, SdsJsonReader* r) {
+    uint8_t* ptr = (uint8_t*)section + field->offset;
+
+    switch (field->type) {
+        case SDS_FIELD_BOOL: {
+            bool val;
+            if (sds_json_get_bool_field(r, field->name, &val)) {
+                *ptr = val ? 1 : 0;
+            }
+            break;
+        }
+        case SDS_FIELD_UINT8: {
+            uint8_t val;
+            if (sds_json_get_uint8_field(r, field->name, &val)) {
+                *ptr = val;
+            }
+            break;
+        }
+        case SDS_FIELD_INT8: {
+            int32_t val;
+            if (sds_json_get_int_field(r, field->name, &val)) {
+                *(int8_t*)ptr = (int8_t)val;
+            }
+            break;
+        }
+        case SDS_FIELD_UINT16: {
+            uint32_t val;
+            if (sds_json_get_uint_field(r, field->name, &val)) {
+                uint16_t val16 = (uint16_t)val;
+                memcpy(ptr, &val16, sizeof(val16));
+            }
+            break;
+        }
+        case SDS_FIELD_INT16: {
+            int32_t val;
+            if (sds_json_get_int_field(r, field->name, &val)) {
+                int16_t val16 = (int16_t)val;
+                memcpy(ptr, &val16, sizeof(val16));
+            }
+            break;
+        }
+        case SDS_FIELD_UINT32: {
+            uint32_t val;
+            if (sds_json_get_uint_field(r, field->name, &val)) {
+                memcpy(ptr, &val, sizeof(val));
+            }
+            break;
+        }
+        case SDS_FIELD_INT32: {
+            int32_t val;
+            if (sds_json_get_int_field(r, field->name, &val)) {
+                memcpy(ptr, &val, sizeof(val));
+            }
+            break;
+        }
+        case SDS_FIELD_FLOAT: {
+            float val;
+            if (sds_json_get_float_field(r, field->name, &val)) {
+                memcpy(ptr, &val, sizeof(val));
+            }
+            break;
+        }
+        case SDS_FIELD_STRING:
+            sds_json_get_string_field(r, field->name, (char*)ptr, field->size);
+            break;
+    }
+}
+
+void sds_deserialize_section(SdsJsonReader* r, void* section,
+                             const SdsFieldMeta* fields, uint8_t field_count) {
+    if (!r || !section || !fields) return;
+
+    for (uint8_t i = 0; i < field_count; i++) {
+        deserialize_field(&fields[i], section, r);
+    }
+}
+
 /**
  * Serialize only changed fields to JSON (delta sync).
  * 
@@ -1251,6 +1251,64 @@ TEST(eviction_callback_invoked) {
     ASSERT_STR_EQ(g_evicted_node_id, "device1");
 }
 
+static int g_batch_eviction_calls = 0;
+static size_t g_batch_eviction_count = 0;
+static char g_batch_evicted_ids[4][64];
+
+static void test_batch_eviction_callback(const char** table_types, const char** node_ids,
+                                         size_t count, void* user_data) {
+    (void)table_types;
+    (void)user_data;
+    g_batch_eviction_calls++;
+    g_batch_eviction_count = count;
+    for (size_t i = 0; i < count && i < 4; i++) {
+        strncpy(g_batch_evicted_ids[i], node_ids[i], sizeof(g_batch_evicted_ids[i]) - 1);
+    }
+}
+
+TEST(eviction_batch_callback_invoked_once_per_sweep) {
+    g_batch_eviction_calls = 0;
+    g_batch_eviction_count = 0;
+    
+    init_sds_with_mock_eviction("owner_node", TEST_EVICTION_GRACE_MS);
+    
+    TestOwnerTable table = {0};
+    register_owner_table_with_eviction_offsets(&table, "TestTable");
+    sds_on_devices_evicted_batch(test_batch_eviction_callback, NULL);
+    
+    /* Two devices come online */
+    sds_mock_inject_message_str(
+        "sds/TestTable/status/device1",
+        "{\"online\":true,\"error_code\":0,\"battery_level\":90}"
+    );
+    sds_mock_inject_message_str(
+        "sds/TestTable/status/device2",
+        "{\"online\":true,\"error_code\":0,\"battery_level\":80}"
+    );
+    ASSERT_EQ(table.status_count, 2);
+    
+    /* Both go offline via LWT */
+    sds_mock_inject_message_str(
+        "sds/lwt/device1",
+        "{\"online\":false,\"node\":\"device1\",\"ts\":0}"
+    );
+    sds_mock_inject_message_str(
+        "sds/lwt/device2",
+        "{\"online\":false,\"node\":\"device2\",\"ts\":0}"
+    );
+    
+    /* Advance time past grace period */
+    sds_mock_advance_time(TEST_EVICTION_GRACE_MS + 10);
+    sds_loop();
+    
+    /* Both evictions reported in a single batch */
+    ASSERT_EQ(g_batch_eviction_calls, 1);
+    ASSERT_EQ((int)g_batch_eviction_count, 2);
+    ASSERT_STR_EQ(g_batch_evicted_ids[0], "device1");
+    ASSERT_STR_EQ(g_batch_evicted_ids[1], "device2");
+    ASSERT_EQ(table.status_count, 0);
+}
+
 TEST(eviction_disabled_when_grace_zero) {
     init_sds_with_mock("owner_node");
     
@@ -1752,6 +1810,101 @@ TEST(raw_callback_wildcard_hash) {
  * MAIN
  * ============================================================================ */
 
+/* ============== Section Serialization by Descriptor Tests ============== */
+
+typedef struct {
+    float temperature;
+    uint16_t count;
+    bool enabled;
+    char label[16];
+    int8_t trim;
+} DescTestSection;
+
+static const SdsFieldMeta DESC_TEST_FIELDS[] = {
+    { "temperature", SDS_FIELD_FLOAT, offsetof(DescTestSection, temperature), sizeof(float) },
+    { "count", SDS_FIELD_UINT16, offsetof(DescTestSection, count), sizeof(uint16_t) },
+    { "enabled", SDS_FIELD_BOOL, offsetof(DescTestSection, enabled), sizeof(bool) },
+    { "label", SDS_FIELD_STRING, offsetof(DescTestSection, label), 16 },
+    { "trim", SDS_FIELD_INT8, offsetof(DescTestSection, trim), sizeof(int8_t) },
+};
+#define DESC_TEST_FIELD_COUNT (sizeof(DESC_TEST_FIELDS) / sizeof(DESC_TEST_FIELDS[0]))
+
+TEST(serialize_section_all_fields) {
+    DescTestSection section = { 21.5f, 7, true, "abc", -5 };
+    char buffer[256];
+    SdsJsonWriter w;
+
+    sds_json_writer_init(&w, buffer, sizeof(buffer));
+    sds_json_start_object(&w);
+    sds_serialize_section(&w, &section, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+    sds_json_end_object(&w);
+
+    ASSERT(!sds_json_has_error(&w));
+    const char* json = sds_json_get_string(&w);
+    ASSERT_STR_CONTAINS(json, "\"temperature\":21.5");
+    ASSERT_STR_CONTAINS(json, "\"count\":7");
+    ASSERT_STR_CONTAINS(json, "\"enabled\":true");
+    ASSERT_STR_CONTAINS(json, "\"label\":\"abc\"");
+    ASSERT_STR_CONTAINS(json, "\"trim\":-5");
+}
+
+TEST(deserialize_section_roundtrip) {
+    DescTestSection section = { 21.5f, 7, true, "abc", -5 };
+    char buffer[256];
+    SdsJsonWriter w;
+
+    sds_json_writer_init(&w, buffer, sizeof(buffer));
+    sds_json_start_object(&w);
+    sds_serialize_section(&w, &section, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+    sds_json_end_object(&w);
+
+    DescTestSection out;
+    memset(&out, 0, sizeof(out));
+    SdsJsonReader r;
+    sds_json_reader_init(&r, sds_json_get_string(&w), sds_json_get_length(&w));
+    sds_deserialize_section(&r, &out, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+
+    ASSERT_FLOAT_EQ(out.temperature, 21.5f, 0.001f);
+    ASSERT_EQ(out.count, 7);
+    ASSERT(out.enabled);
+    ASSERT_STR_EQ(out.label, "abc");
+    ASSERT_EQ(out.trim, -5);
+}
+
+TEST(deserialize_section_missing_fields_untouched) {
+    DescTestSection section = { 21.5f, 7, true, "abc", -5 };
+    const char* json = "{\"count\":42}";
+
+    SdsJsonReader r;
+    sds_json_reader_init(&r, json, strlen(json));
+    sds_deserialize_section(&r, &section, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+
+    ASSERT_EQ(section.count, 42);
+    ASSERT_FLOAT_EQ(section.temperature, 21.5f, 0.001f);  /* Untouched */
+    ASSERT(section.enabled);
+    ASSERT_STR_EQ(section.label, "abc");
+}
+
+TEST(serialize_section_null_params) {
+    DescTestSection section = { 0 };
+    char buffer[64];
+    SdsJsonWriter w;
+    SdsJsonReader r;
+
+    sds_json_writer_init(&w, buffer, sizeof(buffer));
+    sds_json_reader_init(&r, "{}", 2);
+
+    /* None of these should crash */
+    sds_serialize_section(NULL, &section, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+    sds_serialize_section(&w, NULL, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+    sds_serialize_section(&w, &section, NULL, DESC_TEST_FIELD_COUNT);
+    sds_deserialize_section(NULL, &section, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+    sds_deserialize_section(&r, NULL, DESC_TEST_FIELDS, DESC_TEST_FIELD_COUNT);
+    sds_deserialize_section(&r, &section, NULL, DESC_TEST_FIELD_COUNT);
+}
+
+/* ============== Main ============== */
+
 int main(void) {
     printf("\n");
     printf("╔══════════════════════════════════════════════════════════════╗\n");
@@ -1835,6 +1988,7 @@ int main(void) {
     RUN_TEST(eviction_cancelled_on_reconnect);
     RUN_TEST(eviction_triggers_after_grace_period);
     RUN_TEST(eviction_callback_invoked);
+    RUN_TEST(eviction_batch_callback_invoked_once_per_sweep);
     RUN_TEST(eviction_disabled_when_grace_zero);
     
     printf("\n─── Large Section Tests (1KB Support) ───\n");
@@ -1846,6 +2000,12 @@ int main(void) {
     RUN_TEST(delta_sync_enabled_in_config);
     RUN_TEST(delta_float_tolerance_configurable);
     
+    printf("\n─── Section Serialization by Descriptor Tests ───\n");
+    RUN_TEST(serialize_section_all_fields);
+    RUN_TEST(deserialize_section_roundtrip);
+    RUN_TEST(deserialize_section_missing_fields_untouched);
+    RUN_TEST(serialize_section_null_params);
+
     printf("\n─── Raw Publish API Tests ───\n");
     RUN_TEST(is_connected_returns_true_when_connected);
     RUN_TEST(is_connected_returns_false_when_not_initialized);
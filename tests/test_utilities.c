@@ -503,12 +503,38 @@ TEST(is_device_online_not_exists) {
 
 TEST(is_device_online_null_params) {
     setup_owner_with_devices();
-    
+
     ASSERT(!sds_is_device_online(NULL, "NodeTest", "device_01", 30000));
     ASSERT(!sds_is_device_online(&g_owner_table, NULL, "device_01", 30000));
     ASSERT(!sds_is_device_online(&g_owner_table, "NodeTest", NULL, 30000));
 }
 
+TEST(are_devices_online_not_exists) {
+    setup_owner_with_devices();
+
+    const char* ids[] = { "nonexistent_a", "nonexistent_b" };
+    uint64_t bitmap = 0xFFFFFFFFFFFFFFFFULL;
+
+    uint8_t checked = sds_are_devices_online(
+        &g_owner_table, "NodeTest", ids, 2, 30000, &bitmap);
+
+    ASSERT_EQ(2, checked);
+    ASSERT_EQ(0, (int)bitmap);  /* No bits set for unknown devices */
+}
+
+TEST(are_devices_online_null_params) {
+    setup_owner_with_devices();
+
+    const char* ids[] = { "device_01" };
+    uint64_t bitmap = 0xFFFFFFFFFFFFFFFFULL;
+
+    ASSERT_EQ(0, sds_are_devices_online(NULL, "NodeTest", ids, 1, 30000, &bitmap));
+    ASSERT_EQ(0, (int)bitmap);  /* Bitmap cleared even on bad args */
+    ASSERT_EQ(0, sds_are_devices_online(&g_owner_table, NULL, ids, 1, 30000, &bitmap));
+    ASSERT_EQ(0, sds_are_devices_online(&g_owner_table, "NodeTest", NULL, 1, 30000, &bitmap));
+    ASSERT_EQ(0, sds_are_devices_online(&g_owner_table, "NodeTest", ids, 1, 30000, NULL));
+}
+
 /* Node iterator callback */
 static int g_iter_count = 0;
 static char g_iter_nodes[8][SDS_MAX_NODE_ID_LEN];
@@ -614,6 +640,8 @@ int main(void) {
     RUN_TEST(find_node_status_null_params);
     RUN_TEST(is_device_online_not_exists);
     RUN_TEST(is_device_online_null_params);
+    RUN_TEST(are_devices_online_not_exists);
+    RUN_TEST(are_devices_online_null_params);
     RUN_TEST(foreach_node_empty);
     RUN_TEST(foreach_node_null_params);
     